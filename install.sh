@@ -546,10 +546,10 @@ if [[ "$INSTALL_VAD" == true ]]; then
     echo -e "       ${CYAN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
     echo -e "       ${YELLOW}This may take several minutes...${NC}"
     echo ""
-    pip install torch torchaudio jinja2 "sympy>=1.13.3"
+    pip install torch torchaudio silero-vad jinja2 "sympy>=1.13.3"
     echo ""
-    echo -e "       ${GREEN}✓ PyTorch + torchaudio installed${NC}"
-    echo -e "       ${YELLOW}Note: Silero VAD model (~2MB) will download on first use${NC}"
+    echo -e "       ${GREEN}✓ PyTorch + torchaudio + Silero VAD installed${NC}"
+    echo -e "       ${YELLOW}Note: Silero VAD model ships with silero-vad (no download)${NC}"
 fi
 
 # Build SpeechAnalyzer CLI if needed
@@ -698,7 +698,7 @@ fi
 if [[ "$INSTALL_VAD" == true ]]; then
     "$INSTALL_DIR/venv/bin/python" -c "import torch; import torchaudio; print('OK')" 2>/dev/null && {
         echo -e "  ${GREEN}✓${NC} VAD auto-stop ready (Silero VAD)"
-        echo -e "     ${YELLOW}Silero model (~2MB) downloads on first use${NC}"
+        echo -e "     ${YELLOW}Silero model bundled with silero-vad (loads offline)${NC}"
     } || {
         echo -e "  ${YELLOW}!${NC} VAD: Silero model will download on first use (~2MB)"
     }
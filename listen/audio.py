@@ -9,6 +9,7 @@ We MUST fully close and release the stream when done recording.
 
 import numpy as np
 import sounddevice as sd
+from collections import deque
 from typing import Callable, Optional
 import threading
 
@@ -43,8 +44,10 @@ class AudioCapture:
         self.on_audio = on_audio
         self._stream: Optional[sd.InputStream] = None
         self._is_running = False
-        self._buffer: list[np.ndarray] = []
-        self._lock = threading.Lock()
+        # Bounded deque: the audio callback appends without locking and the
+        # oldest chunks fall off in O(1) once the cap is reached
+        self._buffer: deque[np.ndarray] = deque(maxlen=self.MAX_BUFFER_CHUNKS)
+        self._lock = threading.Lock()  # Serializes consumers only, never the callback
         log.info("AudioCapture initialized")
 
     def __del__(self):
@@ -74,15 +77,13 @@ class AudioCapture:
         if status:
             log.warning(f"Audio callback status: {status}")
 
-        # Copy data to avoid issues with buffer reuse
-        audio_chunk = indata.copy().flatten()
+        # flatten() always copies, which is what protects us from PortAudio
+        # reusing indata - no separate .copy() needed
+        audio_chunk = indata.flatten()
 
-        # Add to buffer with size limit (memory optimization)
-        with self._lock:
-            self._buffer.append(audio_chunk)
-            # Trim oldest chunks if buffer exceeds max size
-            if len(self._buffer) > self.MAX_BUFFER_CHUNKS:
-                self._buffer = self._buffer[-self.MAX_BUFFER_CHUNKS:]
+        # Add to buffer; maxlen drops the oldest chunk (memory optimization).
+        # deque.append is atomic, so the real-time thread never waits on a lock.
+        self._buffer.append(audio_chunk)
 
         # Call callback if set
         if self.on_audio:
@@ -96,7 +97,7 @@ class AudioCapture:
 
         log.info("Starting audio capture...")
         self._is_running = True
-        self._buffer = []
+        self._buffer.clear()
 
         try:
             self._stream = sd.InputStream(
@@ -139,17 +140,23 @@ class AudioCapture:
             Concatenated audio data as numpy array
         """
         with self._lock:
-            if not self._buffer:
-                return np.array([], dtype=self.DTYPE)
+            # Pop rather than copy-and-clear so a chunk appended concurrently
+            # by the callback is either returned now or kept for next time
+            chunks = []
+            while True:
+                try:
+                    chunks.append(self._buffer.popleft())
+                except IndexError:
+                    break
 
-            audio = np.concatenate(self._buffer)
-            self._buffer = []
-            return audio
+        if not chunks:
+            return np.array([], dtype=self.DTYPE)
+        return np.concatenate(chunks)
 
     def clear_buffer(self) -> None:
         """Clear the audio buffer."""
         with self._lock:
-            self._buffer = []
+            self._buffer.clear()
 
     @property
     def is_running(self) -> bool:
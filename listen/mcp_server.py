@@ -31,7 +31,8 @@ log.debug("ptt_controller imported")
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.coordination import (
     signal_stop_speaking, is_speaking, force_stop_tts,
-    wait_for_tts_complete, clear_tts_complete_signal, clear_barge_in_signal
+    wait_for_tts_complete, clear_tts_complete_signal, clear_barge_in_signal,
+    clear_stale_signals
 )
 log.debug("shared.coordination imported")
 
@@ -370,6 +371,7 @@ def get_segment_transcription(wait: bool = True, timeout: float = 120.0) -> str:
 
 
 if __name__ == "__main__":
+    clear_stale_signals()
     log.info("Starting MCP server via mcp.run()...")
     log.info("Available tools: start_ptt_mode (with auto_stop/auto_start), stop_ptt_mode, get_ptt_status, get_segment_transcription, interrupt_conversation")
     log.info("Phase 1 - VAD auto-stop: Use start_ptt_mode(auto_stop=True) to enable automatic end-of-speech detection")
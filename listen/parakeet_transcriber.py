@@ -61,7 +61,7 @@ class ParakeetTranscriber(BaseTranscriber):
 
                 log.info(f"Loading Parakeet model: {self.model_name} (~2GB RAM)")
                 self._model = from_pretrained(self.model_name)
-                self._last_use_time = time.time()
+                self._last_use_time = time.monotonic()
                 log.info("Parakeet model loaded successfully")
 
             except ImportError:
@@ -84,7 +84,7 @@ class ParakeetTranscriber(BaseTranscriber):
         """Ensure model is loaded, loading it if necessary."""
         if self._model is None:
             self._load_model()
-        self._last_use_time = time.time()
+        self._last_use_time = time.monotonic()
 
     def transcribe(
         self,
@@ -176,7 +176,7 @@ def _start_idle_checker() -> None:
         while True:
             time.sleep(60)  # Check every minute
             if _transcriber is not None and _transcriber._model is not None:
-                idle_time = time.time() - _transcriber._last_use_time
+                idle_time = time.monotonic() - _transcriber._last_use_time
                 if idle_time > IDLE_TIMEOUT_SECONDS:
                     log.info(f"Model idle for {idle_time:.0f}s, unloading to free memory")
                     _transcriber._unload_model()
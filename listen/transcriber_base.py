@@ -4,12 +4,14 @@ Allows switching between Whisper, Parakeet MLX, etc.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, NamedTuple
+from dataclasses import dataclass
+from typing import Optional
 import numpy as np
 
 
-class TranscriptionResult(NamedTuple):
-    """Result of a transcription."""
+@dataclass(frozen=True, slots=True)
+class TranscriptionResult:
+    """Result of a transcription (attribute access only, not a tuple)."""
     text: str
     language: str
     confidence: float
@@ -10,9 +10,11 @@ Key features:
 - Low latency (~30ms per chunk)
 """
 
+import functools
+import os
+import queue
 import numpy as np
 import threading
-import time
 from typing import Optional, Callable
 from pathlib import Path
 
@@ -20,15 +22,36 @@ from .logger import get_logger
 
 log = get_logger("vad")
 
+# Silero is tiny: intra-op thread fan-out and the sync barrier cost more than
+# the math itself. Must be set before torch is first imported.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+os.environ.setdefault("MKL_NUM_THREADS", "1")
+
 # Silero VAD constants
 SILERO_SAMPLE_RATE = 16000  # Silero expects 16kHz
 SILERO_CHUNK_MS = 32  # Process 32ms chunks (512 samples at 16kHz)
-SILERO_CHUNK_SAMPLES = int(SILERO_SAMPLE_RATE * SILERO_CHUNK_MS / 1000)
+SILERO_CHUNK_SAMPLES = 512
+assert SILERO_CHUNK_SAMPLES == SILERO_SAMPLE_RATE * SILERO_CHUNK_MS // 1000
+RING_BUFFER_CHUNKS = 64  # Preallocated audio ring: 64 chunks (~2s), grows if ever exceeded
+SILERO_HUB_REPO = "snakers4/silero-vad"
+SILERO_HUB_CACHE_DIR = "snakers4_silero-vad_master"  # torch hub checkout dir name
 
 # Default thresholds
 DEFAULT_SPEECH_THRESHOLD = 0.3  # Probability threshold for speech detection (lower = more sensitive)
 DEFAULT_SILENCE_DURATION_MS = 1500  # 1.5s silence = end of utterance
 MIN_SPEECH_DURATION_MS = 300  # Minimum speech before considering silence
+HYSTERESIS_MARGIN = 0.15  # While speaking, stay in speech until prob < threshold - margin
+DEFAULT_MIN_EVENT_INTERVAL_MS = 250  # Suppress speech-start this soon after a speech-end
+
+# Callback events (coalesced through a bounded queue)
+EVENT_SPEECH_START = "speech_start"
+EVENT_SPEECH_END = "speech_end"
+EVENT_QUEUE_SIZE = 8
+
+# Silence pre-gate: chunks whose peak amplitude is below the gate skip the model
+DEFAULT_SILENCE_GATE = 0.005  # Initial gate, ~-46 dBFS
+MAX_SILENCE_GATE = 0.02  # Never gate above this (would clip quiet speech)
+SILENCE_GATE_CALIBRATION_CHUNKS = 94  # ~3s of audio used to measure the noise floor
 
 
 class SileroVAD:
@@ -49,6 +72,8 @@ class SileroVAD:
         min_speech_duration_ms: int = MIN_SPEECH_DURATION_MS,
         on_speech_start: Optional[Callable[[], None]] = None,
         on_speech_end: Optional[Callable[[], None]] = None,
+        exit_threshold: Optional[float] = None,
+        min_event_interval_ms: int = DEFAULT_MIN_EVENT_INTERVAL_MS,
     ):
         """
         Initialize Silero VAD.
@@ -59,22 +84,63 @@ class SileroVAD:
             min_speech_duration_ms: Minimum speech duration before silence detection
             on_speech_start: Callback when speech starts
             on_speech_end: Callback when speech ends (after silence threshold)
+            exit_threshold: Probability below which ongoing speech counts as silence
+                            (default: speech_threshold - HYSTERESIS_MARGIN)
+            min_event_interval_ms: Debounce for a speech-start right after a speech-end
         """
         self.speech_threshold = speech_threshold
+        self.exit_threshold = (
+            exit_threshold if exit_threshold is not None
+            else max(0.0, speech_threshold - HYSTERESIS_MARGIN)
+        )
         self.silence_duration_ms = silence_duration_ms
         self.min_speech_duration_ms = min_speech_duration_ms
+        self.min_event_interval_ms = min_event_interval_ms
+
+        # Thresholds in samples, compared against the sample counter per chunk
+        self._silence_samples_threshold = silence_duration_ms * SILERO_SAMPLE_RATE // 1000
+        self._min_speech_samples = min_speech_duration_ms * SILERO_SAMPLE_RATE // 1000
+        self._min_event_interval_samples = min_event_interval_ms * SILERO_SAMPLE_RATE // 1000
         self.on_speech_start = on_speech_start
         self.on_speech_end = on_speech_end
 
         self._model = None
+        self._torch = None  # torch module, bound in _load_model (keeps import off the hot path)
+        self._device = "cpu"
         self._is_running = False
+
+        # Producer-only state: written by process_audio() on the audio thread
+        # without locking. Readers (is_speaking) see plain attribute loads,
+        # which are atomic under the GIL.
         self._is_speaking = False
-        self._speech_start_time: Optional[float] = None
-        self._last_speech_time: Optional[float] = None
+        self._speech_start_sample: Optional[int] = None
+        self._last_speech_sample: Optional[int] = None
+        # Sample at which trailing silence ends the utterance; re-armed on
+        # every speech chunk so the silence path is a single compare
+        self._end_deadline_sample: Optional[int] = None
+        self._samples_processed = 0  # Monotonic sample counter, the VAD's clock
+        self._silence_gate = DEFAULT_SILENCE_GATE
+        # Noise-floor samples, preallocated and refilled each session
+        self._calibration_peaks = np.empty(SILENCE_GATE_CALIBRATION_CHUNKS, dtype=np.float32)
+        self._calibration_count = 0
+        self._last_end_sample: Optional[int] = None
+
+        # Preallocated audio ring: the writer appends at _write_idx, complete
+        # chunks are read as views from _read_idx. No per-chunk allocation.
+        self._ring = np.empty(SILERO_CHUNK_SAMPLES * RING_BUFFER_CHUNKS, dtype=np.float32)
+        self._read_idx = 0
+        self._write_idx = 0
+        self._abs_scratch = np.empty_like(self._ring)  # |samples| for the peak pre-gate
+        self._ring_tensor = None  # Persistent torch view sharing the ring's memory
+
+        # Lifecycle lock: serializes start()/stop() only, never taken per chunk
         self._lock = threading.Lock()
 
-        # Audio buffer for resampling if needed
-        self._audio_buffer = np.array([], dtype=np.float32)
+        # Single persistent worker runs callbacks off the audio thread, in order.
+        # Events go through a bounded queue so oscillation can't pile up work.
+        self._cb_thread: Optional[threading.Thread] = None
+        self._event_q: queue.Queue = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+        self._last_dispatched_event: Optional[str] = None
 
         log.info(f"SileroVAD initialized: threshold={speech_threshold}, "
                  f"silence={silence_duration_ms}ms, min_speech={min_speech_duration_ms}ms")
@@ -86,23 +152,33 @@ class SileroVAD:
 
         try:
             import torch
+            self._torch = torch
             log.info("Loading Silero VAD model...")
 
-            # Load from torch hub (will cache locally)
-            self._model, utils = torch.hub.load(
-                repo_or_dir='snakers4/silero-vad',
-                model='silero_vad',
-                force_reload=False,
-                onnx=False,  # Use PyTorch for Apple Silicon optimization
-                trust_repo=True
-            )
+            torch.set_num_threads(1)
+            try:
+                torch.set_num_interop_threads(1)
+            except RuntimeError:
+                # Only settable once, before any inter-op parallel work
+                log.debug("torch inter-op threads already initialized")
+
+            model = self._load_jit_model(torch)
+            device = "cpu"
+            if torch.cuda.is_available():
+                model = model.to("cuda")
+                device = "cuda"
+                log.info("Silero VAD moved to CUDA")
+
+            # Validate the chunk size / sample rate once here so process_audio()
+            # needs no per-chunk error handling: a failure there is a real bug.
+            # Doubles as JIT warm-up, so the first live chunk isn't slow.
+            with torch.no_grad():
+                model(torch.zeros(SILERO_CHUNK_SAMPLES, device=device), SILERO_SAMPLE_RATE)
+            model.reset_states()
 
-            # Get the VAD iterator function
-            (self._get_speech_timestamps,
-             self._save_audio,
-             self._read_audio,
-             self._VADIterator,
-             self._collect_chunks) = utils
+            self._model = model
+            self._device = device
+            self._ring_tensor = torch.from_numpy(self._ring)
 
             log.info("Silero VAD model loaded successfully")
 
@@ -115,6 +191,56 @@ class SileroVAD:
             log.error(f"Failed to load Silero VAD: {e}")
             raise
 
+    @staticmethod
+    def _load_jit_model(torch):
+        """
+        Load the Silero JIT model without network access when possible.
+
+        Order: the silero-vad package (model shipped as package data), then the
+        local torch hub cache, then torch hub over the network (first run only).
+        """
+        try:
+            from silero_vad import load_silero_vad
+            log.info("Loading Silero VAD from silero-vad package")
+            return load_silero_vad(onnx=False)
+        except ImportError:
+            log.debug("silero-vad package not installed")
+
+        # A github repo_or_dir resolves the default branch online on every
+        # load, even when cached; loading the checkout directly skips that.
+        hub_dir = Path(torch.hub.get_dir()) / SILERO_HUB_CACHE_DIR
+        if (hub_dir / "hubconf.py").exists():
+            log.info(f"Loading Silero VAD from local hub cache: {hub_dir}")
+            model, _ = torch.hub.load(
+                repo_or_dir=str(hub_dir),
+                model='silero_vad',
+                source='local',
+                onnx=False,
+            )
+            return model
+
+        # Load from torch hub (will cache locally)
+        log.info("Downloading Silero VAD from torch hub...")
+        model, _ = torch.hub.load(
+            repo_or_dir=SILERO_HUB_REPO,
+            model='silero_vad',
+            force_reload=False,
+            onnx=False,  # Use PyTorch for Apple Silicon optimization
+            trust_repo=True
+        )
+        return model
+
+    def _calibrate_silence_gate(self, peak: float) -> None:
+        """Collect chunk peaks and set the silence gate from the noise floor."""
+        self._calibration_peaks[self._calibration_count] = peak
+        self._calibration_count += 1
+        if self._calibration_count < SILENCE_GATE_CALIBRATION_CHUNKS:
+            return
+
+        noise_floor = float(np.percentile(self._calibration_peaks, 5))
+        self._silence_gate = min(MAX_SILENCE_GATE, max(DEFAULT_SILENCE_GATE, noise_floor))
+        log.debug(f"Silence gate calibrated: noise_floor={noise_floor:.4f}, gate={self._silence_gate:.4f}")
+
     def start(self) -> None:
         """Start VAD processing."""
         with self._lock:
@@ -124,9 +250,26 @@ class SileroVAD:
             self._load_model()
             self._is_running = True
             self._is_speaking = False
-            self._speech_start_time = None
-            self._last_speech_time = None
-            self._audio_buffer = np.array([], dtype=np.float32)
+            self._speech_start_sample = None
+            self._last_speech_sample = None
+            self._end_deadline_sample = None
+            self._samples_processed = 0
+            self._silence_gate = DEFAULT_SILENCE_GATE
+            self._calibration_count = 0
+            self._last_end_sample = None
+            # Fresh queue per session: a worker still draining the previous
+            # session keeps its own queue and exits on its sentinel.
+            self._event_q = queue.Queue(maxsize=EVENT_QUEUE_SIZE)
+            self._last_dispatched_event = None
+            self._cb_thread = threading.Thread(
+                target=self._callback_worker,
+                args=(self._event_q,),
+                daemon=True,
+                name="vad-cb",
+            )
+            self._cb_thread.start()
+            self._read_idx = 0
+            self._write_idx = 0
 
             # Reset model state
             if self._model is not None:
@@ -142,12 +285,32 @@ class SileroVAD:
 
             self._is_running = False
             self._is_speaking = False
+
+            # Pending callbacks still run; the worker exits on the sentinel.
+            # Never block on a full queue: stop() may run on the worker itself
+            # (from a callback), and nothing else would drain it. Drop the
+            # oldest events instead, so the sentinel always gets in.
+            if self._cb_thread is not None:
+                while True:
+                    try:
+                        self._event_q.put_nowait(None)
+                        break
+                    except queue.Full:
+                        try:
+                            self._event_q.get_nowait()
+                        except queue.Empty:
+                            pass
+                self._cb_thread = None
+
             log.info("VAD stopped")
 
     def process_audio(self, audio_chunk: np.ndarray) -> bool:
         """
         Process an audio chunk and detect speech.
 
+        Must be called from a single producer thread (the audio callback).
+        The hot path takes no lock; only start()/stop() synchronize.
+
         Args:
             audio_chunk: Audio samples (float32, 16kHz expected)
 
@@ -157,63 +320,163 @@ class SileroVAD:
         if not self._is_running or self._model is None:
             return False
 
-        import torch
+        torch = self._torch
 
-        # Add to buffer
-        self._audio_buffer = np.concatenate([self._audio_buffer, audio_chunk])
+        # Append to the ring (casts to float32 in place)
+        n = len(audio_chunk)
+        if self._write_idx + n > len(self._ring):
+            self._compact_ring(n)
+        self._ring[self._write_idx:self._write_idx + n] = audio_chunk
+        self._write_idx += n
 
-        # Process in SILERO_CHUNK_SAMPLES chunks
+        # Process every complete SILERO_CHUNK_SAMPLES chunk in one pass.
+        # The model is stateful (RNN), so chunks must still run in order rather
+        # than as independent batch rows, but the backlog is reshaped and
+        # converted to a tensor once instead of slicing the buffer per chunk.
         speech_detected = False
 
-        while len(self._audio_buffer) >= SILERO_CHUNK_SAMPLES:
-            chunk = self._audio_buffer[:SILERO_CHUNK_SAMPLES]
-            self._audio_buffer = self._audio_buffer[SILERO_CHUNK_SAMPLES:]
-
-            # Convert to torch tensor
-            tensor = torch.from_numpy(chunk).float()
-
-            # Get speech probability
-            with torch.no_grad():
-                speech_prob = self._model(tensor, SILERO_SAMPLE_RATE).item()
-
-            is_speech = speech_prob >= self.speech_threshold
-            current_time = time.time()
-
-            if is_speech:
-                speech_detected = True
-                self._last_speech_time = current_time
-
-                if not self._is_speaking:
-                    # Speech just started
-                    self._is_speaking = True
-                    self._speech_start_time = current_time
-                    log.debug(f"Speech started (prob={speech_prob:.2f})")
-
-                    if self.on_speech_start:
-                        self.on_speech_start()
-
-            else:
-                # Check for end of speech
-                if self._is_speaking and self._last_speech_time is not None:
-                    silence_duration = (current_time - self._last_speech_time) * 1000
-                    speech_duration = (current_time - self._speech_start_time) * 1000 if self._speech_start_time else 0
+        r = self._read_idx
+        num_chunks = (self._write_idx - r) // SILERO_CHUNK_SAMPLES
+        if num_chunks == 0:
+            return False
 
-                    # Only trigger end-of-speech if:
-                    # 1. Silence duration exceeds threshold
-                    # 2. There was enough speech before the silence
-                    if (silence_duration >= self.silence_duration_ms and
-                        speech_duration >= self.min_speech_duration_ms):
+        consumed = num_chunks * SILERO_CHUNK_SAMPLES
+        frames = self._ring[r:r + consumed].reshape(num_chunks, SILERO_CHUNK_SAMPLES)
+        self._read_idx = r + consumed
+        if self._read_idx == self._write_idx:
+            # Fully drained: rewind so the next write starts at the front
+            self._read_idx = self._write_idx = 0
+
+        batch = self._ring_tensor[r:r + consumed].view(num_chunks, SILERO_CHUNK_SAMPLES)
+        batch = batch.to(self._device)  # No-op on CPU
+
+        # Peaks for every chunk in one vectorized pass, into preallocated scratch
+        abs_frames = self._abs_scratch[:consumed].reshape(num_chunks, SILERO_CHUNK_SAMPLES)
+        np.abs(frames, out=abs_frames)
+        peaks = abs_frames.max(axis=1).tolist()
+
+        # Bind per-call invariants to locals: the loop runs ~31 times per
+        # second of audio and attribute loads add up
+        model = self._model
+        speech_threshold = self.speech_threshold
+        exit_threshold = self.exit_threshold
+        silence_samples_threshold = self._silence_samples_threshold
+        min_speech_samples = self._min_speech_samples
+        silence_gate = self._silence_gate
+        calibrating = self._calibration_count < SILENCE_GATE_CALIBRATION_CHUNKS
+        emit = self._emit
+        now = self._samples_processed
+
+        with torch.no_grad():
+            for i in range(num_chunks):
+                peak = peaks[i]
+                if calibrating:
+                    self._calibrate_silence_gate(peak)
+                    silence_gate = self._silence_gate
+                    calibrating = self._calibration_count < SILENCE_GATE_CALIBRATION_CHUNKS
+
+                speaking = self._is_speaking
+
+                # Get speech probability. Obvious silence skips the model entirely,
+                # but once speaking the model always runs so low-energy word
+                # endings are not clipped.
+                if peak < silence_gate and not speaking:
+                    speech_prob = 0.0
+                else:
+                    speech_prob = model(batch[i], SILERO_SAMPLE_RATE).item()
+
+                # The sample counter is the clock, so a backlog processed in one
+                # call still advances time by 32ms per chunk
+                now += SILERO_CHUNK_SAMPLES
+                self._samples_processed = now
+
+                # Hysteresis: entering speech needs speech_threshold, staying in
+                # speech only needs exit_threshold, so borderline SNR doesn't flap
+                threshold = exit_threshold if speaking else speech_threshold
+
+                if speech_prob >= threshold:
+                    speech_detected = True
+                    self._last_speech_sample = now
+
+                    if not speaking:
+                        # Speech just started
+                        self._is_speaking = True
+                        self._speech_start_sample = now
+                        log.debug(f"Speech started (prob={speech_prob:.2f})")
+
+                        if (self._last_end_sample is not None and
+                                now - self._last_end_sample < self._min_event_interval_samples):
+                            log.debug("Speech restarted right after end, debouncing start event")
+                        else:
+                            emit(EVENT_SPEECH_START)
+
+                    # End needs both the silence window and the minimum speech length
+                    self._end_deadline_sample = max(
+                        now + silence_samples_threshold,
+                        self._speech_start_sample + min_speech_samples,
+                    )
+
+                elif speaking and now >= self._end_deadline_sample:
+                    # Enough trailing silence after enough speech
+                    silence_samples = now - self._last_speech_sample
+                    speech_samples = now - self._speech_start_sample
+                    log.info(f"End of speech detected: "
+                             f"{speech_samples * 1000 // SILERO_SAMPLE_RATE}ms speech, "
+                             f"{silence_samples * 1000 // SILERO_SAMPLE_RATE}ms silence")
+
+                    self._is_speaking = False
+                    self._speech_start_sample = None
+                    self._end_deadline_sample = None
+                    self._last_end_sample = now
+
+                    emit(EVENT_SPEECH_END)
 
-                        log.info(f"End of speech detected: {speech_duration:.0f}ms speech, "
-                                f"{silence_duration:.0f}ms silence")
+        return speech_detected
 
-                        self._is_speaking = False
-                        self._speech_start_time = None
+    def _compact_ring(self, incoming: int) -> None:
+        """Move unread samples to the front of the ring, growing it if needed."""
+        pending = self._write_idx - self._read_idx
+        needed = pending + incoming
+        if needed > len(self._ring):
+            size = len(self._ring)
+            while size < needed:
+                size *= 2
+            ring = np.empty(size, dtype=np.float32)
+            ring[:pending] = self._ring[self._read_idx:self._write_idx]
+            self._ring = ring
+            self._abs_scratch = np.empty_like(ring)
+            if self._torch is not None:
+                self._ring_tensor = self._torch.from_numpy(ring)
+            log.debug(f"VAD ring buffer grown to {size} samples")
+        elif pending:
+            self._ring[:pending] = self._ring[self._read_idx:self._write_idx]
+        self._read_idx = 0
+        self._write_idx = pending
+
+    def _emit(self, event: str) -> None:
+        """Queue a speech event for the callback worker (never blocks)."""
+        try:
+            self._event_q.put_nowait(event)
+        except queue.Full:
+            log.warning(f"VAD event queue full, dropping {event}")
+
+    def _callback_worker(self, events: queue.Queue) -> None:
+        """Deliver queued events in order, merging identical consecutive edges."""
+        while True:
+            event = events.get()
+            if event is None:  # Sentinel from stop()
+                return
 
-                        if self.on_speech_end:
-                            self.on_speech_end()
+            if event == self._last_dispatched_event:
+                continue
+            self._last_dispatched_event = event
 
-        return speech_detected
+            callback = self.on_speech_start if event == EVENT_SPEECH_START else self.on_speech_end
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    log.error(f"Error in {event} callback: {e}")
 
     @property
     def is_speaking(self) -> bool:
@@ -230,22 +493,40 @@ class SileroVAD:
 _vad: Optional[SileroVAD] = None
 
 
+@functools.lru_cache(maxsize=1)
+def _build_vad(speech_threshold: float, silence_duration_ms: int) -> SileroVAD:
+    """Construct the shared VAD, cached on its (hashable) configuration."""
+    return SileroVAD(
+        speech_threshold=speech_threshold,
+        silence_duration_ms=silence_duration_ms,
+    )
+
+
 def get_vad(
     speech_threshold: float = DEFAULT_SPEECH_THRESHOLD,
     silence_duration_ms: int = DEFAULT_SILENCE_DURATION_MS,
     on_speech_start: Optional[Callable[[], None]] = None,
     on_speech_end: Optional[Callable[[], None]] = None,
 ) -> SileroVAD:
-    """Get or create global VAD instance."""
+    """
+    Get or create global VAD instance for this configuration.
+
+    Callbacks can't be cache keys, so they are bound after construction
+    (whenever given).
+    """
     global _vad
-    if _vad is None:
-        _vad = SileroVAD(
-            speech_threshold=speech_threshold,
-            silence_duration_ms=silence_duration_ms,
-            on_speech_start=on_speech_start,
-            on_speech_end=on_speech_end,
-        )
-    return _vad
+    vad = _build_vad(speech_threshold, silence_duration_ms)
+    if vad is not _vad:
+        if _vad is not None:
+            # Configuration changed: the cache evicted the old instance
+            _vad.stop()
+        _vad = vad
+
+    if on_speech_start is not None:
+        vad.on_speech_start = on_speech_start
+    if on_speech_end is not None:
+        vad.on_speech_end = on_speech_end
+    return vad
 
 
 def destroy_vad() -> None:
@@ -254,6 +535,7 @@ def destroy_vad() -> None:
     if _vad is not None:
         _vad.stop()
         _vad = None
+        _build_vad.cache_clear()
         log.info("Global VAD destroyed")
 
 
@@ -3,15 +3,26 @@
 
 import subprocess
 import threading
+import atexit
+import contextlib
+import functools
 import os
+import re
+import select
+import shutil
+import socket
 import sys
 import time
 import tempfile
 import base64
-import urllib.request
+import hashlib
+import importlib.util
+import http.client
+from urllib.parse import urlsplit
 import json
 import logging
-from queue import Queue, Empty
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from mcp.server.fastmcp import FastMCP
 
@@ -19,7 +30,7 @@ from mcp.server.fastmcp import FastMCP
 sys.path.insert(0, str(Path(__file__).parent / "say"))
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Import coordination module for Phase 2 auto-start signaling
+# Import coordination module for Phase 2 auto-start signaling and player tracking
 from shared.coordination import signal_tts_complete
 
 # Configure espeak library path for French/multilingual phonemization (macOS)
@@ -43,36 +54,74 @@ logging.basicConfig(
 logger = logging.getLogger("claude-say")
 
 
+# One KEY=value assignment per line; comment lines never match. A value
+# wrapped in matching quotes is captured without them.
+_ENV_LINE_RE = re.compile(
+    r"""^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*"""
+    r"""(?:"(.*)"|'(.*)'|(.*?))[^\S\n]*$""",
+    re.MULTILINE,
+)
+
+
+def _parse_env_file(env_path: Path) -> dict[str, str]:
+    """Parse KEY=value lines from a .env file."""
+    env_vars = {}
+    for m in _ENV_LINE_RE.finditer(env_path.read_text()):
+        key, dq, sq, bare = m.groups()
+        env_vars[key] = dq if dq is not None else sq if sq is not None else bare
+    return env_vars
+
+
 def load_env_file():
     """Load configuration from ~/.mcp-claude-say/.env file.
 
     This allows centralized config without requiring python-dotenv.
     Only sets env vars if not already set (os.environ.setdefault).
+    The parsed result is cached next to the file, keyed by its mtime and size.
     """
     env_path = Path.home() / ".mcp-claude-say" / ".env"
-    if not env_path.exists():
+    try:
+        st = env_path.stat()
+    except FileNotFoundError:
         logger.debug(f"No .env file found at {env_path}")
         return
 
+    cache_path = env_path.with_name(".env.cache.json")
     try:
+        env_vars = None
+        try:
+            with open(cache_path, "rb") as f:
+                # The cache holds secrets (API keys): one readable by others,
+                # e.g. written by an older version, is replaced below
+                if os.fstat(f.fileno()).st_mode & 0o077:
+                    raise OSError("cache file is group/world readable")
+                cached = json.loads(f.read())
+            if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+                env_vars = cached["vars"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass  # Missing or stale-format cache: reparse
+
+        if env_vars is None:
+            env_vars = _parse_env_file(env_path)
+            try:
+                # Write-then-rename so a concurrent reader never sees a partial file
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                # Owner-only from creation, whatever the umask or .env's mode
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with open(fd, "w") as f:
+                    os.fchmod(fd, 0o600)  # A leftover tmp file keeps its old mode
+                    f.write(json.dumps(
+                        {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "vars": env_vars}
+                    ))
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.debug(f"Could not write .env cache: {e}")
+
         loaded_vars = []
-        for line in env_path.read_text().splitlines():
-            line = line.strip()
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            # Parse KEY=value (handle values with = in them)
-            if '=' in line:
-                key, val = line.split('=', 1)
-                key = key.strip()
-                val = val.strip()
-                # Remove surrounding quotes if present
-                if val and len(val) >= 2:
-                    if (val[0] == '"' and val[-1] == '"') or (val[0] == "'" and val[-1] == "'"):
-                        val = val[1:-1]
-                # Only set if not already in environment
-                os.environ.setdefault(key, val)
-                loaded_vars.append(f"{key}={val}")
+        for key, val in env_vars.items():
+            # Only set if not already in environment
+            os.environ.setdefault(key, val)
+            loaded_vars.append(f"{key}={val}")
         logger.debug(f"Loaded from .env: {', '.join(loaded_vars)}")
     except Exception as e:
         logger.warning(f"Error loading .env: {e}")
@@ -91,27 +140,239 @@ STOP_SIGNAL_FILE = Path("/tmp/claude-voice-stop")
 BARGE_IN_SIGNAL_FILE = Path("/tmp/claude-barge-in")
 
 
+# Stop datagram socket, one per server process (claude-listen signals every
+# live one). Once bound, a stop costs nothing until it actually arrives.
+STOP_SIGNAL_SOCKET_DIR = Path("/tmp")
+STOP_SIGNAL_SOCKET = STOP_SIGNAL_SOCKET_DIR / f"claude-voice-stop.{os.getpid()}.sock"
+_stop_event = threading.Event()
+# Set when a stop cut playback short. The playback waits consume the stop
+# signal itself, so this is how speech_worker learns to drop its queue.
+_playback_stopped = threading.Event()
+_stop_socket_ok = False  # False until the listener is bound: use the signal file
+_stop_listener_attempted = False
+
+
 def check_and_clear_stop_signal() -> bool:
     """Check if stop signal exists and clear it. Returns True if signal was present."""
-    if STOP_SIGNAL_FILE.exists():
+    if _stop_socket_ok:
+        if _stop_event.is_set():
+            _stop_event.clear()
+            return True
+        return False
+    # unlink() doubles as the existence check: one syscall either way
+    try:
+        STOP_SIGNAL_FILE.unlink()
+    except FileNotFoundError:
+        return False
+    except OSError:
+        pass  # Present but not removable: still a stop request
+    return True
+
+
+def raise_stop_signal():
+    """Signal this server's own worker to stop (tool handlers, same process)."""
+    if _stop_socket_ok:
+        _stop_event.set()
+    else:
+        STOP_SIGNAL_FILE.touch()
+
+
+def _start_stop_listener() -> bool:
+    """Bind the stop datagram socket and start its listener. False if unavailable."""
+    global _stop_socket_ok, _stop_listener_attempted
+    _stop_listener_attempted = True
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
         try:
-            STOP_SIGNAL_FILE.unlink()
-        except:
+            STOP_SIGNAL_SOCKET.unlink()  # Leftover from a previous process with our pid
+        except FileNotFoundError:
             pass
-        return True
-    return False
+        sock.bind(str(STOP_SIGNAL_SOCKET))
+    except OSError as e:
+        logger.warning(f"Stop socket unavailable ({e}), falling back to signal file")
+        return False
+
+    atexit.register(_remove_stop_socket)
+    threading.Thread(target=_stop_listener, args=(sock,), daemon=True, name="stop-listener").start()
+    # From here on stops arrive as datagrams; a stale file would never be read
+    try:
+        STOP_SIGNAL_FILE.unlink()
+    except FileNotFoundError:
+        pass
+    _stop_socket_ok = True
+    logger.info(f"Listening for stop signals on {STOP_SIGNAL_SOCKET}")
+    return True
+
+
+def _remove_stop_socket():
+    try:
+        STOP_SIGNAL_SOCKET.unlink()
+    except OSError:
+        pass
+
+
+def _stop_listener(sock: socket.socket):
+    """Block on the stop socket; each datagram sets the stop flag and ends playback."""
+    while True:
+        try:
+            sock.recv(64)
+        except OSError:
+            return
+        logger.info("Stop datagram received")
+        _stop_event.set()
+        # Ending the child is what wakes a waiting worker (see _wait_proc_or_stop)
+        terminate_players()
+        # The Chatterbox service plays in its own process (sounddevice), so
+        # only its /stop ends that audio and unblocks a worker in /speak
+        if USE_CHATTERBOX:
+            stop_chatterbox()
+
+
+# Stop-file re-check interval when the kernel can only tell us about child exit
+STOP_POLL_INTERVAL_MS = 50
+
+
+def _wait_proc_or_stop(proc: subprocess.Popen) -> bool:
+    """
+    Block until proc exits or a stop is signaled (then terminate proc).
+    Returns True if playback was stopped by the signal.
+
+    proc must have been started with _tracked_player().
+    """
+    if _stop_socket_ok:
+        # The stop listener terminates published playback itself, so a plain
+        # waitpid() covers both outcomes. A stop that arrived before proc was
+        # published is caught by the check up front.
+        if _stop_event.is_set():
+            proc.terminate()
+        proc.wait()
+        stopped = check_and_clear_stop_signal()
+    elif hasattr(select, "kqueue"):
+        stopped = _wait_proc_or_stop_kqueue(proc)
+    else:
+        stopped = _wait_proc_or_stop_poll(proc)
+    if stopped:
+        _playback_stopped.set()
+    return stopped
+
+
+def _wait_proc_or_stop_kqueue(proc: subprocess.Popen) -> bool:
+    """macOS: sleep in kevent() until the child exits or the signal directory changes."""
+    kq = select.kqueue()
+    # O_EVTONLY (macOS) watches the directory without holding its volume busy
+    dir_fd = os.open(STOP_SIGNAL_FILE.parent, getattr(os, "O_EVTONLY", 0x8000))
+    try:
+        kq.control([select.kevent(
+            dir_fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE,
+        )], 0)
+        try:
+            kq.control([select.kevent(
+                proc.pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD,
+                fflags=select.KQ_NOTE_EXIT,
+            )], 0)
+        except ProcessLookupError:
+            pass  # Already exited; poll() below sees it
+
+        # Re-check after every wakeup: a directory write may be an unrelated
+        # file, and the signal may predate the watch
+        while True:
+            if check_and_clear_stop_signal():
+                proc.terminate()
+                return True
+            if proc.poll() is not None:
+                return False
+            kq.control(None, 1)
+    finally:
+        os.close(dir_fd)
+        kq.close()
+
+
+def _wait_proc_or_stop_poll(proc: subprocess.Popen) -> bool:
+    """Linux/other: wait on a pidfd (exit wakes us at once), re-checking the stop file."""
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError:
+            pass  # Already reaped, or kernel without pidfd support
+    try:
+        poller = None
+        if pidfd is not None:
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+        while proc.poll() is None:
+            if check_and_clear_stop_signal():
+                proc.terminate()
+                return True
+            if poller is not None:
+                poller.poll(STOP_POLL_INTERVAL_MS)
+            else:
+                time.sleep(STOP_POLL_INTERVAL_MS / 1000)
+        return False
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
 
 
 mcp = FastMCP("claude-say")
 
 # Global state
-speech_queue: Queue = Queue()
-current_process: subprocess.Popen | None = None
-current_afplay: subprocess.Popen | None = None  # Tracks afplay for Google TTS
+# Speech FIFO: MCP tool handlers append, speech_worker pops. deque append/popleft
+# are atomic, so the only synchronization is an Event to wake the idle worker,
+# plus _front_lock between a drain and the worker's peek-then-pop of the front.
+# Items are (text, voice, rate, use_neural, done); done is an optional Event
+# set once the item has been played or dropped (speak_and_wait waits on it).
+speech_deque: deque = deque()
+speech_event = threading.Event()
+_front_lock = threading.Lock()
+# Players (say/afplay) the worker is blocked on; stoppers terminate them.
+# process_lock makes spawning + registering one step as seen by a stopper.
+_active_players: set[subprocess.Popen] = set()
 process_lock = threading.Lock()
 worker_thread: threading.Thread | None = None
 
 
+@contextlib.contextmanager
+def _tracked_player(args: list[str], **popen_kwargs):
+    """Spawn a player that stop paths can terminate; untracked when the block exits."""
+    with process_lock:
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+            **popen_kwargs,
+        )
+        _active_players.add(proc)
+    try:
+        yield proc
+    finally:
+        with process_lock:
+            _active_players.discard(proc)
+
+
+def terminate_players() -> bool:
+    """Terminate every tracked player that is still running. Returns True if any was."""
+    stopped = False
+    with process_lock:
+        for proc in _active_players:
+            if proc.poll() is None:
+                proc.terminate()
+                stopped = True
+    return stopped
+
+# Drop a speak() identical to the one still waiting at the tail of the queue
+# (a tool calling speak("Processing") in a loop). Off by default: repeating
+# a message can be deliberate.
+TTS_DEDUP = os.getenv("TTS_DEDUP", "0") == "1"
+_dedup_lock = threading.Lock()  # Makes the tail check + append atomic
+
+
 # TTS Backend selection (env-configurable)
 # Options: "kokoro" (local MLX, 82M), "chatterbox" (local neural, 11GB), "google" (cloud, needs API key), "macos" (built-in)
 TTS_BACKEND = os.getenv("TTS_BACKEND", "macos").lower()
@@ -119,6 +380,9 @@ TTS_BACKEND = os.getenv("TTS_BACKEND", "macos").lower()
 # Kokoro MLX configuration (for TTS_BACKEND=kokoro)
 KOKORO_VOICE = os.getenv("KOKORO_VOICE", "af_heart")  # Default: American English female
 KOKORO_SPEED = float(os.getenv("KOKORO_SPEED", "1.0"))
+KOKORO_QUANT_BITS = int(os.getenv("KOKORO_QUANT_BITS", "0"))  # 4 or 8 = quantized Linear layers, 0 = off
+KOKORO_DTYPE = os.getenv("KOKORO_DTYPE") or None  # float16 / bfloat16 / float32; unset = checkpoint dtype
+KOKORO_PIPE_PLAYBACK = os.getenv("KOKORO_PIPE_PLAYBACK", "0") == "1"  # Stream to afplay over a pipe (verified setups only)
 
 # Chatterbox configuration (for TTS_BACKEND=chatterbox)
 CHATTERBOX_URL = os.getenv("CHATTERBOX_URL", "http://127.0.0.1:8123")
@@ -130,45 +394,175 @@ GOOGLE_CLOUD_API_KEY = os.getenv("GOOGLE_CLOUD_API_KEY", "")
 GOOGLE_VOICE = os.getenv("GOOGLE_VOICE", "en-US-Neural2-F")  # Neural2 voices are in free tier
 GOOGLE_LANGUAGE = os.getenv("GOOGLE_LANGUAGE", "en-US")
 
+# Google TTS audio cache: repeated phrases replay from disk instead of
+# round-tripping to the API. Content-addressed by voice, language and text.
+GOOGLE_TTS_CACHE_DIR = Path.home() / ".mcp-claude-say" / "tts-cache"
+GOOGLE_TTS_CACHE_MAX_MB = int(os.getenv("GOOGLE_TTS_CACHE_MAX_MB", "200"))  # 0 disables the cache
+GOOGLE_TTS_CACHE_TTL_DAYS = float(os.getenv("GOOGLE_TTS_CACHE_TTL_DAYS", "0"))  # 0 = never expire
+# Short stock phrases synthesized into the cache in the background at startup,
+# so their first use doesn't wait on the API (comma-separated, empty disables)
+GOOGLE_TTS_PREWARM = [
+    phrase.strip()
+    for phrase in os.getenv("GOOGLE_TTS_PREWARM", "Ready.,Done.,Failed.,Okay.,Got it.").split(",")
+    if phrase.strip()
+]
+_prewarm_started = False
+# Cache size as of the last scan plus what was stored since (None: not yet
+# scanned). Only when it passes the limit does a scan + eviction run, on its
+# own thread, trimming to a low-water mark so rescans stay rare.
+_google_cache_bytes: int | None = None
+_google_cache_evicting = False
+_google_cache_lock = threading.Lock()
+_google_cache_janitor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="google-cache")
+GOOGLE_TTS_CACHE_LOW_WATER = 0.9
+
+# Keep-alive HTTPS connection to the Google TTS API: utterances after the
+# first skip the TCP + TLS handshake
+GOOGLE_TTS_HOST = "texttospeech.googleapis.com"
+GOOGLE_TTS_PATH = "/v1/text:synthesize"
+_google_conn: http.client.HTTPSConnection | None = None
+_google_conn_lock = threading.Lock()
+
+# Google synthesis runs ahead on this thread while the worker plays: later
+# sentences of the current text and the next queued item, in submission
+# order (one worker: requests share _google_conn)
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_google_prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="google-tts")
+
+# Everything in a synthesize request except the text is fixed at import:
+# headers are built once and the voice/audioConfig tail is pre-serialized
+_GOOGLE_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Goog-Api-Key": GOOGLE_CLOUD_API_KEY  # Header, not URL param - more secure
+}
+_GOOGLE_PAYLOAD_TAIL = json.dumps({
+    "voice": {
+        "languageCode": GOOGLE_LANGUAGE,
+        "name": GOOGLE_VOICE
+    },
+    "audioConfig": {
+        "audioEncoding": "MP3",
+        "speakingRate": 1.0
+    }
+}).encode("ascii")[1:]  # Drop the leading '{'; spliced after the input object
+
 # Kokoro TTS instance (lazy-loaded)
 _kokoro_tts = None
 _kokoro_lock = threading.Lock()
+# First synthesis pays MLX's compile cost: a warmup thread absorbs it at
+# startup and real utterances wait for it instead of racing it
+_kokoro_warm = threading.Event()  # Set once the warmup has finished (or failed)
+_kokoro_warmup_started = False
 
 # Log configuration at startup
 logger.info(f"TTS Backend: {TTS_BACKEND}")
 if TTS_BACKEND == "kokoro":
     logger.info(f"Kokoro voice: {KOKORO_VOICE}, speed: {KOKORO_SPEED}")
 
-# Health check cache to avoid blocking worker thread
-_last_health_check = 0.0
+# Chatterbox health, refreshed by a background pinger so the worker thread
+# never blocks on an HTTP probe
 _health_ok = False
-_health_lock = threading.Lock()
-HEALTH_CHECK_TTL = 2.0  # seconds
+_health_ready = threading.Event()  # Set once the first probe has finished
+_health_thread: threading.Thread | None = None
+HEALTH_CHECK_TTL = 2.0  # seconds between probes
+
+# Keep-alive connection to Chatterbox, one per thread (http.client is not
+# thread-safe). Saves a TCP handshake per /health and /speak call.
+_chatterbox_addr = urlsplit(CHATTERBOX_URL)
+_chatterbox_base_path = _chatterbox_addr.path.rstrip("/")
+_CHATTERBOX_JSON_HEADERS = {"Content-Type": "application/json"}
+_chatterbox_local = threading.local()
+
+# /speak body is always {"text": ..., "voice": ...}: the default voice is
+# serialized once and the body is assembled from bytes per call
+_DEFAULT_VOICE_JSON = json.dumps(DEFAULT_VOICE).encode("ascii")
+
+# Absolute paths for spawned players: with close_fds=False and no cwd or
+# preexec_fn, CPython launches them via posix_spawn rather than fork+exec
+# (our own fds are non-inheritable by default, so nothing leaks)
+SAY_PATH = "/usr/bin/say"
+AFPLAY_PATH = "/usr/bin/afplay"
+
+# Kokoro audio is already PCM in memory: play it in-process on one long-lived
+# sounddevice stream (found without importing PortAudio until first use)
+_HAS_SOUNDDEVICE = importlib.util.find_spec("sounddevice") is not None
+_pcm_stream = None  # sounddevice.OutputStream, opened lazily; worker thread only
+PCM_WRITE_FRAMES = 1024  # ~43 ms at 24 kHz: how often a stop is noticed
 
 # Ready notification sound (macOS system sound)
 READY_SOUND = "/System/Library/Sounds/Pop.aiff"
+# System sounds don't come and go while the server runs: probe once
+_READY_SOUND_OK = os.path.exists(READY_SOUND)
+
+
+def _chatterbox_request(method: str, path: str, body: bytes | None = None,
+                        timeout: float = 60) -> tuple[int, bytes]:
+    """
+    Send a request to Chatterbox over this thread's persistent connection.
+    Returns (status, body). A GET is retried once on a fresh connection if the
+    server dropped the idle one; a POST is not, since /speak could be spoken twice.
+    """
+    headers = _CHATTERBOX_JSON_HEADERS if body is not None else {}
+    url_path = _chatterbox_base_path + path
+    for attempt in range(2):
+        conn = getattr(_chatterbox_local, "conn", None)
+        if conn is None:
+            conn_cls = (http.client.HTTPSConnection if _chatterbox_addr.scheme == "https"
+                        else http.client.HTTPConnection)
+            conn = conn_cls(_chatterbox_addr.hostname, _chatterbox_addr.port, timeout=timeout)
+            _chatterbox_local.conn = conn
+        conn.timeout = timeout
+        if conn.sock is not None:
+            # An idle socket that is readable was closed by the server (EOF):
+            # reconnect before sending rather than find out from the reply
+            if select.select([conn.sock], [], [], 0)[0]:
+                conn.close()
+            else:
+                conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, url_path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.status, response.read()
+        except ConnectionError:
+            conn.close()
+            _chatterbox_local.conn = None
+            if attempt or method != "GET":
+                raise
+        except Exception:
+            conn.close()
+            _chatterbox_local.conn = None
+            raise
+
+
+def _probe_chatterbox_health() -> bool:
+    """One /health round-trip over the calling thread's keep-alive connection."""
+    try:
+        _, body = _chatterbox_request("GET", "/health", timeout=1)
+        # Only one flag matters, so skip the JSON parse (FastAPI emits
+        # compact JSON; the spaced form covers other servers)
+        return b'"model_loaded":true' in body or b'"model_loaded": true' in body
+    except (OSError, http.client.HTTPException):
+        return False
+
+
+def _health_pinger():
+    """Probe Chatterbox every HEALTH_CHECK_TTL seconds (also keeps its connection warm)."""
+    global _health_ok
+    while True:
+        _health_ok = _probe_chatterbox_health()
+        _health_ready.set()
+        time.sleep(HEALTH_CHECK_TTL)
 
 
 def chatterbox_available() -> bool:
     """
     Check if Chatterbox TTS service is running.
-    Caches result for HEALTH_CHECK_TTL seconds to avoid blocking.
-    Thread-safe via lock.
+    Reads the flag kept fresh by the background pinger (a plain attribute
+    load); only the very first call may wait for the initial probe.
     """
-    global _last_health_check, _health_ok
-    now = time.time()
-
-    with _health_lock:
-        if now - _last_health_check < HEALTH_CHECK_TTL:
-            return _health_ok
-        try:
-            req = urllib.request.urlopen(f"{CHATTERBOX_URL}/health", timeout=1)
-            data = json.loads(req.read().decode())
-            _health_ok = data.get("model_loaded", False)
-        except:
-            _health_ok = False
-        _last_health_check = now
-        return _health_ok
+    if not _health_ready.is_set():
+        _health_ready.wait(timeout=1.5)
+    return _health_ok
 
 
 def speak_with_chatterbox(text: str, blocking: bool = True, voice: str | None = None) -> bool:
@@ -178,40 +572,36 @@ def speak_with_chatterbox(text: str, blocking: bool = True, voice: str | None =
     """
     try:
         endpoint = "/speak" if blocking else "/speak_async"
-        payload = {"text": text, "voice": voice or DEFAULT_VOICE}
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            f"{CHATTERBOX_URL}{endpoint}",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-        response = urllib.request.urlopen(req, timeout=60)
-        return response.status == 200
-    except:
+        voice_json = json.dumps(voice).encode("ascii") if voice else _DEFAULT_VOICE_JSON
+        # json.dumps escapes to ASCII by default, so the pieces are valid UTF-8
+        data = b'{"text":' + json.dumps(text).encode("ascii") + b',"voice":' + voice_json + b'}'
+        status, _ = _chatterbox_request("POST", endpoint, body=data, timeout=60)
+        return status == 200
+    except (OSError, http.client.HTTPException):
         return False
 
 
 def stop_chatterbox() -> bool:
     """Stop Chatterbox playback."""
     try:
-        req = urllib.request.Request(
-            f"{CHATTERBOX_URL}/stop",
-            method="POST"
-        )
-        urllib.request.urlopen(req, timeout=2)
-        return True
-    except:
+        status, _ = _chatterbox_request("POST", "/stop", timeout=2)
+        return status == 200
+    except (OSError, http.client.HTTPException):
         return False
 
 
+# Config is read once at import, so this can't change while the server runs
+_GOOGLE_TTS_CONFIGURED = bool(GOOGLE_CLOUD_API_KEY) and TTS_BACKEND == "google"
+
+
 def google_tts_available() -> bool:
     """Check if Google Cloud TTS is configured."""
-    return bool(GOOGLE_CLOUD_API_KEY) and TTS_BACKEND == "google"
+    return _GOOGLE_TTS_CONFIGURED
 
 
+@functools.lru_cache(maxsize=1)
 def kokoro_available() -> bool:
-    """Check if Kokoro MLX TTS is available."""
+    """Check if Kokoro MLX TTS is available (probed once, then memoized)."""
     if TTS_BACKEND != "kokoro":
         return False
     try:
@@ -235,26 +625,94 @@ def get_kokoro_tts():
                     logger.warning(f"Invalid KOKORO_VOICE '{voice_to_use}', using 'af_heart'")
                     voice_to_use = "af_heart"
 
-                _kokoro_tts = MLXAudioTTS(voice=voice_to_use, speed=KOKORO_SPEED)
-                logger.info(f"Kokoro TTS initialized: voice={voice_to_use}, speed={KOKORO_SPEED}")
+                _kokoro_tts = MLXAudioTTS(
+                    voice=voice_to_use,
+                    speed=KOKORO_SPEED,
+                    quant_bits=KOKORO_QUANT_BITS,
+                    dtype=KOKORO_DTYPE,
+                    pipe_playback=KOKORO_PIPE_PLAYBACK,
+                )
+                logger.info(
+                    f"Kokoro TTS initialized: voice={voice_to_use}, speed={KOKORO_SPEED}, "
+                    f"quant_bits={KOKORO_QUANT_BITS}, dtype={KOKORO_DTYPE or 'default'}"
+                )
             except Exception as e:
                 logger.error(f"Failed to initialize Kokoro TTS: {e}")
                 return None
         return _kokoro_tts
 
 
+def _warm_kokoro():
+    """Load Kokoro ahead of the first utterance (the load runs a warmup pass)."""
+    try:
+        tts = get_kokoro_tts()
+        if tts is not None:
+            tts.preload()
+            logger.info("Kokoro TTS warmed up")
+    except Exception as e:
+        logger.debug(f"Kokoro warmup failed: {e}")
+    finally:
+        _kokoro_warm.set()
+
+
+# Set while _play_pcm is writing to the output stream: in-process playback
+# has no player process for stop_speaking to find
+_pcm_active = threading.Event()
+
+# Private per-process directory for reusable playback files (created lazily)
+_playback_dir: str | None = None
+
+
+def _playback_path(name: str) -> str:
+    """Path of a reusable playback file, removed with its directory at exit."""
+    global _playback_dir
+    if _playback_dir is None:
+        _playback_dir = tempfile.mkdtemp(prefix="claude-say-")
+        atexit.register(shutil.rmtree, _playback_dir, True)
+    return os.path.join(_playback_dir, name)
+
+
+def _play_pcm(audio_array, sr: int) -> bool:
+    """
+    Play mono float samples on the shared output stream, blocking until done.
+    Returns True if a stop signal cut playback short.
+    """
+    global _pcm_stream
+    import sounddevice as sd
+
+    if _pcm_stream is None or _pcm_stream.samplerate != sr:
+        if _pcm_stream is not None:
+            _pcm_stream.close()
+        _pcm_stream = sd.OutputStream(samplerate=sr, channels=1, dtype="float32")
+
+    samples = audio_array.astype("float32", copy=False).reshape(-1, 1)
+    _pcm_stream.start()
+    _pcm_active.set()
+    try:
+        for start in range(0, len(samples), PCM_WRITE_FRAMES):
+            if check_and_clear_stop_signal():
+                _pcm_stream.abort()  # Drop whatever is still buffered
+                _playback_stopped.set()
+                return True
+            _pcm_stream.write(samples[start:start + PCM_WRITE_FRAMES])
+    finally:
+        if _pcm_stream.active:
+            _pcm_stream.stop()  # Returns once the buffered tail has played
+        _pcm_active.clear()
+    return False
+
+
 def speak_with_kokoro(text: str, blocking: bool = True, voice: str = None) -> bool:
     """
     Speak using Kokoro MLX TTS.
     Returns True if successful, False if unavailable.
     """
-    global current_afplay
     tts = get_kokoro_tts()
     if tts is None:
         return False
 
     try:
-        import soundfile as sf
+        from mlx_audio_tts import write_wav
 
         # Use specified voice, or configured KOKORO_VOICE, or instance default
         if voice and voice in tts.VOICES:
@@ -264,45 +722,53 @@ def speak_with_kokoro(text: str, blocking: bool = True, voice: str = None) -> bo
 
         logger.debug(f"Kokoro TTS using voice: {use_voice}")
 
+        if _kokoro_warmup_started:
+            _kokoro_warm.wait()  # Don't run MLX concurrently with the warmup
+
         # Synthesize audio
         audio_array, sr = tts.synthesize(text, voice=use_voice)
 
-        # Save to temp file and play with afplay
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, prefix="kokoro_tts_") as f:
-            sf.write(f.name, audio_array, sr)
-            temp_path = f.name
+        if blocking and _HAS_SOUNDDEVICE:
+            # Write the samples to the long-lived output stream: no player
+            # process to spawn, no WAV encode, no file
+            check_and_clear_stop_signal()
+            try:
+                _play_pcm(audio_array, sr)
+                return True
+            except Exception as e:
+                logger.warning(f"In-process playback failed, using afplay: {e}")
+
+        # Save to a file and play with afplay. Blocking playback finishes before
+        # the next utterance, so it overwrites one reusable path in place.
+        if blocking:
+            temp_path = _playback_path("kokoro_tts.wav")
+        else:
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, prefix="kokoro_tts_") as f:
+                temp_path = f.name
+        write_wav(temp_path, audio_array, sr)
 
         try:
             # Clear stale stop signals before starting playback
             check_and_clear_stop_signal()
 
             if blocking:
-                with process_lock:
-                    current_afplay = subprocess.Popen(
-                        ["afplay", temp_path],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                # Poll for completion while checking stop signal
-                while current_afplay.poll() is None:
-                    if check_and_clear_stop_signal():
-                        current_afplay.terminate()
-                        break
-                    time.sleep(0.05)  # Check every 50ms
-                with process_lock:
-                    current_afplay = None
+                # Sleep until playback ends or the stop signal appears
+                with _tracked_player([AFPLAY_PATH, temp_path]) as proc:
+                    _wait_proc_or_stop(proc)
             else:
                 subprocess.Popen(
-                    ["afplay", temp_path],
+                    [AFPLAY_PATH, temp_path],
                     stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False,
                 )
-        finally:
-            if blocking:
+        except Exception:
+            if not blocking:
                 try:
                     os.unlink(temp_path)
-                except:
+                except OSError:
                     pass
+            raise
 
         return True
     except Exception as e:
@@ -310,94 +776,310 @@ def speak_with_kokoro(text: str, blocking: bool = True, voice: str = None) -> bo
         return False
 
 
-def stop_kokoro():
-    """Stop any Kokoro playback (via afplay)."""
-    global current_afplay
-    with process_lock:
-        if current_afplay and current_afplay.poll() is None:
-            current_afplay.terminate()
-            current_afplay = None
+def _google_cache_path(text: str) -> Path:
+    """Cache location for an utterance (sharded by the first hash byte)."""
+    key = hashlib.sha256(f"{GOOGLE_VOICE}|{GOOGLE_LANGUAGE}|{text}".encode("utf-8")).hexdigest()
+    return GOOGLE_TTS_CACHE_DIR / key[:2] / f"{key}.mp3"
+
+
+def _google_cache_lookup(path: Path) -> bool:
+    """Return True on a fresh cache hit, bumping its atime for LRU eviction."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return False
+    now = time.time()  # Wall clock: compared against file timestamps
+    if GOOGLE_TTS_CACHE_TTL_DAYS and now - st.st_mtime > GOOGLE_TTS_CACHE_TTL_DAYS * 86400:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return False
+    try:
+        os.utime(path, (now, st.st_mtime))
+    except OSError:
+        pass
+    return True
+
+
+def _google_cache_store(path: Path, audio_content: bytes) -> bool:
+    """Atomically write synthesized audio into the cache. Returns False on failure."""
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            f.write(audio_content)
+            tmp_path = f.name
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Google TTS cache write failed: {e}")
+        if tmp_path:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return False
+
+    global _google_cache_bytes, _google_cache_evicting
+    with _google_cache_lock:
+        if _google_cache_bytes is not None:
+            _google_cache_bytes += len(audio_content)
+            if _google_cache_bytes <= GOOGLE_TTS_CACHE_MAX_MB * 1024 * 1024:
+                return True
+        if _google_cache_evicting:
             return True
-    return False
+        _google_cache_evicting = True
+    _google_cache_janitor.submit(_evict_google_cache)
+    return True
 
 
-def speak_with_google(text: str, blocking: bool = True) -> bool:
+def _evict_google_cache():
     """
-    Speak using Google Cloud Text-to-Speech API.
-    Returns True if successful, False on error.
+    Scan the cache and delete least-recently-played entries until it is back
+    under the low-water mark of GOOGLE_TTS_CACHE_MAX_MB. Runs on
+    _google_cache_janitor, never on the playback path.
     """
-    global current_afplay
-    if not GOOGLE_CLOUD_API_KEY:
-        return False
+    global _google_cache_bytes, _google_cache_evicting
+    total = None
+    try:
+        total = _scan_and_evict_google_cache()
+    finally:
+        with _google_cache_lock:
+            _google_cache_bytes = total
+            _google_cache_evicting = False
+
 
+def _scan_and_evict_google_cache() -> int | None:
+    """Evict as _evict_google_cache describes; returns the resulting size (None if the scan failed)."""
+    entries = []
+    total = 0
     try:
-        # Build the API request (use header for API key - more secure than URL param)
-        url = "https://texttospeech.googleapis.com/v1/text:synthesize"
-        payload = {
-            "input": {"text": text},
-            "voice": {
-                "languageCode": GOOGLE_LANGUAGE,
-                "name": GOOGLE_VOICE
-            },
-            "audioConfig": {
-                "audioEncoding": "MP3",
-                "speakingRate": 1.0
-            }
-        }
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={
-                "Content-Type": "application/json",
-                "X-Goog-Api-Key": GOOGLE_CLOUD_API_KEY
-            },
-            method="POST"
+        with os.scandir(GOOGLE_TTS_CACHE_DIR) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as files:
+                    for entry in files:
+                        if entry.name.endswith(".mp3"):
+                            st = entry.stat()
+                            entries.append((st.st_atime, st.st_size, entry.path))
+                            total += st.st_size
+    except OSError as e:
+        logger.debug(f"Google TTS cache scan failed: {e}")
+        return None
+
+    limit = GOOGLE_TTS_CACHE_MAX_MB * 1024 * 1024
+    if total <= limit:
+        return total
+    low_water = limit * GOOGLE_TTS_CACHE_LOW_WATER
+    entries.sort()
+    for _, size, entry_path in entries:
+        try:
+            os.unlink(entry_path)
+        except OSError:
+            continue
+        total -= size
+        if total <= low_water:
+            break
+    return total
+
+
+def _google_tts_request(data: bytes) -> tuple[int, bytes]:
+    """
+    POST a synthesize request over the shared keep-alive connection.
+    Returns (status, body). Reconnects once if the idle connection went stale.
+    """
+    global _google_conn
+    with _google_conn_lock:
+        for attempt in range(2):
+            if _google_conn is None:
+                _google_conn = http.client.HTTPSConnection(GOOGLE_TTS_HOST, timeout=30)
+            try:
+                _google_conn.request("POST", GOOGLE_TTS_PATH, body=data, headers=_GOOGLE_HEADERS)
+                response = _google_conn.getresponse()
+                return response.status, response.read()
+            except TimeoutError:
+                # The API is slow, not the socket stale: don't wait twice
+                _google_conn.close()
+                _google_conn = None
+                raise
+            except (OSError, http.client.HTTPException):
+                # Drop the connection so the next attempt (or call) reconnects
+                _google_conn.close()
+                _google_conn = None
+                if attempt:
+                    raise
+
+
+def _feed_stdin(proc: subprocess.Popen, data: bytes):
+    """Write data to a child's stdin and close it (EOF starts/finishes playback)."""
+    try:
+        proc.stdin.write(data)
+        proc.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass  # Child was stopped before reading everything
+
+
+def _synthesize_google(text: str) -> bytes | None:
+    """Synthesize text to MP3 bytes via the Google TTS API. Returns None on HTTP errors."""
+    # Only the text is serialized per call (json.dumps output is ASCII)
+    data = b'{"input":{"text":' + json.dumps(text).encode("ascii") + b'},' + _GOOGLE_PAYLOAD_TAIL
+    status, body = _google_tts_request(data)
+    if status != 200:
+        logger.warning(f"Google TTS request failed: HTTP {status}")
+        return None
+    result = json.loads(body)  # bytes in: no intermediate str copy
+
+    # Decode the audio content
+    return base64.b64decode(result["audioContent"])
+
+
+def _prewarm_google_cache():
+    """Synthesize GOOGLE_TTS_PREWARM phrases into the cache (no playback)."""
+    for phrase in GOOGLE_TTS_PREWARM:
+        cache_path = _google_cache_path(phrase)
+        if _google_cache_lookup(cache_path):
+            continue
+        try:
+            audio_content = _synthesize_google(phrase)
+        except Exception as e:
+            logger.debug(f"Google TTS prewarm stopped: {e}")
+            return
+        if audio_content is not None:
+            _google_cache_store(cache_path, audio_content)
+
+
+def _fetch_google_audio(text: str) -> tuple[str | None, bytes | None] | None:
+    """
+    Get audio for text from the cache or the API.
+    Returns (cached_path, None), or (None, mp3_bytes) when the cache is
+    disabled/unwritable, or None on an API error.
+    """
+    cache_path = _google_cache_path(text) if GOOGLE_TTS_CACHE_MAX_MB > 0 else None
+    if cache_path is not None and _google_cache_lookup(cache_path):
+        logger.debug(f"Google TTS cache hit: {cache_path.name}")
+        return str(cache_path), None
+
+    audio_content = _synthesize_google(text)
+    if audio_content is None:
+        return None
+    if cache_path is not None and _google_cache_store(cache_path, audio_content):
+        return str(cache_path), None
+    # Cache disabled or unwritable: pipe the MP3 straight into afplay
+    return None, audio_content
+
+
+def _play_google_audio(audio_path: str | None, audio_content: bytes | None,
+                       blocking: bool) -> bool:
+    """
+    Play one clip from its cache path or raw bytes.
+    When blocking, returns True if playback was cut short by a stop.
+    """
+    if audio_path is None:
+        # Uncached clip: afplay plays files, so write it out first. Blocking
+        # playback finishes before the next clip, so one path is reused.
+        if blocking:
+            audio_path = _playback_path("google_tts.mp3")
+            with open(audio_path, "wb") as f:
+                f.write(audio_content)
+        else:
+            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False, prefix="google_tts_") as f:
+                f.write(audio_content)
+                audio_path = f.name
+
+    if not blocking:
+        subprocess.Popen(
+            [AFPLAY_PATH, audio_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
-        response = urllib.request.urlopen(req, timeout=30)
-        result = json.loads(response.read().decode())
+        return False
 
-        # Decode the audio content
-        audio_content = base64.b64decode(result["audioContent"])
+    with _tracked_player([AFPLAY_PATH, audio_path]) as proc:
+        # Sleep until playback ends or the stop signal appears
+        return _wait_proc_or_stop(proc)
 
-        # Save to temp file and play
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False, prefix="google_tts_") as f:
-            f.write(audio_content)
-            temp_path = f.name
 
+def _speak_google_pipelined(sentences: list[str]) -> bool:
+    """
+    Play sentence N while the following sentences are synthesized, so the
+    first audio starts after one sentence's round trip instead of the whole
+    text's. Returns False only if nothing could be played.
+    """
+    futures = [_google_prefetch.submit(_fetch_google_audio, s) for s in sentences]
+    # Queued behind this text's sentences, so it never delays their audio
+    _prefetch_upcoming_google()
+    try:
+        for i, future in enumerate(futures):
+            try:
+                audio = future.result()
+            except Exception as e:
+                logger.debug(f"Google TTS request failed: {e}")
+                audio = None
+            if audio is None:
+                if i == 0:
+                    return False  # Nothing played yet: let the caller fall back
+                logger.warning(f"Google TTS failed mid-utterance, dropped {len(futures) - i} sentence(s)")
+                return True
+
+            if i == 0:
+                # Clear stale stop signals before starting playback
+                check_and_clear_stop_signal()
+            if _play_google_audio(*audio, blocking=True):
+                break  # Stopped: skip the rest of the text
+        return True
+    finally:
+        # Don't spend API quota on sentences that will never be played
+        for future in futures:
+            future.cancel()
+
+
+def _prefetch_upcoming_google():
+    """Overlap the next queued item's synthesis with this item's playback."""
+    if GOOGLE_TTS_CACHE_MAX_MB <= 0:
+        return  # Nowhere to keep the result
+    try:
+        upcoming = speech_deque[0]
+    except IndexError:
+        return
+    if upcoming is not None and upcoming[3]:
+        _google_prefetch.submit(_prefetch_google, upcoming[0])
+
+
+def _prefetch_google(text: str):
+    """Synthesize text's sentences into the cache ahead of its turn to play."""
+    for sentence in _SENTENCE_SPLIT_RE.split(text.strip()):
         try:
-            # Clear stale stop signals before starting playback
-            check_and_clear_stop_signal()
+            _fetch_google_audio(sentence)
+        except Exception as e:
+            logger.debug(f"Google TTS prefetch failed: {e}")
+            return
 
-            if blocking:
-                with process_lock:
-                    current_afplay = subprocess.Popen(
-                        ["afplay", temp_path],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                # Poll for completion while checking stop signal
-                while current_afplay.poll() is None:
-                    if check_and_clear_stop_signal():
-                        current_afplay.terminate()
-                        break
-                    time.sleep(0.05)  # Check every 50ms
-                with process_lock:
-                    current_afplay = None
-            else:
-                subprocess.Popen(
-                    ["afplay", temp_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
-        finally:
-            if blocking:
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-            # For non-blocking, file cleanup happens when afplay finishes (not ideal but acceptable)
 
+def speak_with_google(text: str, blocking: bool = True) -> bool:
+    """
+    Speak using Google Cloud Text-to-Speech API.
+    Repeated utterances are served from the on-disk audio cache. Blocking
+    multi-sentence text is synthesized and played sentence by sentence.
+    Returns True if successful, False on error.
+    """
+    if not GOOGLE_CLOUD_API_KEY:
+        return False
+
+    try:
+        if blocking:
+            # Fetches go through _google_prefetch even for one sentence, so
+            # they queue behind (and hit the cache of) any prefetch of this text
+            return _speak_google_pipelined(_SENTENCE_SPLIT_RE.split(text.strip()))
+
+        audio = _fetch_google_audio(text)
+        if audio is None:
+            return False
+
+        # Clear stale stop signals before starting playback
+        check_and_clear_stop_signal()
+        _play_google_audio(*audio, blocking)
         return True
     except Exception as e:
         # Log error but don't crash - will fallback to macOS
@@ -406,102 +1088,207 @@ def speak_with_google(text: str, blocking: bool = True) -> bool:
 
 def play_ready_sound():
     """Play a short notification sound to indicate ready to listen."""
-    if os.path.exists(READY_SOUND):
+    if _READY_SOUND_OK:
         subprocess.Popen(
-            ["afplay", READY_SOUND],
+            [AFPLAY_PATH, READY_SOUND],
             stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
 
 
 def clear_listen_segments():
     """Clear segments from claude-listen to avoid feedback loop."""
-    segment_dir = "/tmp/claude-segments"
-    if os.path.exists(segment_dir):
-        for f in os.listdir(segment_dir):
+    try:
+        dir_fd = os.open("/tmp/claude-segments", os.O_RDONLY | os.O_DIRECTORY)
+    except FileNotFoundError:
+        return
+    try:
+        # Unlink relative to the open directory: no path walk per file
+        with os.scandir(dir_fd) as entries:
+            for entry in entries:
+                try:
+                    os.unlink(entry.name, dir_fd=dir_fd)
+                except OSError:
+                    pass
+    finally:
+        os.close(dir_fd)
+
+
+def enqueue_speech(text: str, voice: str | None, rate: int, use_neural: bool,
+                   done: threading.Event | None = None) -> bool:
+    """
+    Append an utterance and wake the worker.
+    With TTS_DEDUP, a fire-and-forget item identical to the one at the tail
+    of the queue is dropped instead; returns False in that case.
+    """
+    if TTS_DEDUP and done is None:
+        with _dedup_lock:
             try:
-                os.remove(os.path.join(segment_dir, f))
-            except:
-                pass
+                tail = speech_deque[-1]
+            except IndexError:
+                tail = None
+            if tail is not None and tail[:4] == (text, voice, rate, use_neural):
+                return False
+            speech_deque.append((text, voice, rate, use_neural, done))
+    else:
+        speech_deque.append((text, voice, rate, use_neural, done))
+    speech_event.set()
+    return True
+
+
+def finish_speech(item) -> None:
+    """Mark a dequeued item as handled (played, skipped or dropped)."""
+    done = item[4]
+    if done is not None:
+        done.set()
+
+
+def drain_speech_queue() -> int:
+    """
+    Drop every pending item and return the count.
+    Each dropped item is finished, so speak_and_wait callers wake up.
+    """
+    items_cleared = 0
+    with _front_lock:
+        while True:
+            try:
+                item = speech_deque.popleft()
+            except IndexError:
+                return items_cleared
+            if item is not None:
+                finish_speech(item)
+                items_cleared += 1
+
+
+# Most queued items merged into one synthesis / say process
+MAX_SPEECH_BATCH = 8
+
+
+def take_coalescable_speech(voice: str | None, rate: int, use_neural: bool) -> list:
+    """
+    Pop up to MAX_SPEECH_BATCH - 1 queued items with the same voice, rate and
+    backend kind from the front of the queue. The caller owns them and must
+    finish_speech() each.
+    """
+    items = []
+    # Peek before popping, under the drain's lock: an item popped and put
+    # back could otherwise miss a drain running in between and survive a stop
+    with _front_lock:
+        while len(items) < MAX_SPEECH_BATCH - 1:
+            try:
+                item = speech_deque[0]
+            except IndexError:
+                break
+            if item is None or item[3] != use_neural or item[1] != voice or item[2] != rate:
+                break
+            items.append(speech_deque.popleft())
+    return items
 
 
 def speech_worker():
     """Worker thread that processes the speech queue sequentially."""
-    global current_process
     logger.info("Speech worker thread started")
     while True:
         try:
-            item = speech_queue.get(timeout=1.0)
-        except Empty:
+            item = speech_deque.popleft()
+        except IndexError:
+            # Idle: block until enqueue_speech() sets the event. Re-check after
+            # clearing so an append racing the clear isn't slept through.
+            speech_event.clear()
+            if not speech_deque:
+                speech_event.wait()
             continue
 
         if item is None:  # Stop signal
             logger.info("Speech worker received stop signal")
             break
 
+        _playback_stopped.clear()
+
         # Check for stop signal - if present, clear queue and skip this item
         if check_and_clear_stop_signal():
             logger.debug("Stop signal detected, clearing queue")
             # Clear all remaining items in queue
-            while not speech_queue.empty():
-                try:
-                    speech_queue.get_nowait()
-                    speech_queue.task_done()
-                except Empty:
-                    break
-            speech_queue.task_done()  # Mark current item as done
+            drain_speech_queue()
+            finish_speech(item)  # Mark current item as done
             continue  # Skip to next iteration (queue is now empty)
 
-        text, voice, rate, use_neural = item
+        text, voice, rate, use_neural, _ = item
         logger.debug(f"Processing speech: {text[:50]}... (neural={use_neural})")
-        # Remove macOS-specific silence markup for neural backends
-        clean_text = text.replace(f" [[slnc {TRAILING_SILENCE_MS}]]", "")
 
-        # Try Kokoro MLX TTS first (if configured)
-        if use_neural and kokoro_available():
-            if speak_with_kokoro(clean_text, blocking=True, voice=voice):
-                speech_queue.task_done()
-                continue
-            # Fall through to other backends if Kokoro fails
-
-        # Try Google Cloud TTS (if configured)
-        if use_neural and google_tts_available():
-            if speak_with_google(clean_text, blocking=True):
-                speech_queue.task_done()
-                continue
-            # Fall through to other backends if Google fails
-
-        # Try Chatterbox for neural TTS (if enabled)
-        if use_neural and USE_CHATTERBOX and chatterbox_available():
-            if speak_with_chatterbox(clean_text, blocking=True):
-                speech_queue.task_done()
+        # Back-to-back items with the same voice and rate share one synthesis
+        # and one player process. Only macOS say and Kokoro batch: each text
+        # already ends with its [[slnc]] pause (say), and Kokoro synthesizes
+        # newline-separated segments in one call.
+        if not use_neural or kokoro_available():
+            batch = [item, *take_coalescable_speech(voice, rate, use_neural)]
+        else:
+            batch = [item]
+        if len(batch) > 1:
+            logger.debug(f"Coalescing {len(batch) - 1} queued message(s) into one utterance")
+
+        if use_neural:
+            # Neural items carry plain text (no say markup)
+            if _speak_neural("\n".join(queued[0] for queued in batch), voice):
+                for queued in batch:
+                    finish_speech(queued)
+                _drain_if_stopped()
                 continue
-            # Fall through to macOS voice if Chatterbox fails
-
-        # Fallback to macOS 'say' command
-        cmd = ["/usr/bin/say", "-r", str(rate)]
+            # Falling back to say: add the pause that say items are queued with
+            text = " ".join(queued[0] + _SILENCE_SUFFIX for queued in batch)
+        elif len(batch) > 1:
+            text = " ".join(queued[0] for queued in batch)
+
+        # Fallback to macOS 'say' command. The text goes through stdin
+        # ("-f -"), not argv: no ARG_MAX limit on long (coalesced) texts.
+        cmd = [SAY_PATH, "-r", str(rate)]
         if voice:
             cmd.extend(["-v", voice])
-        cmd.append(text)
+        cmd.extend(["-f", "-"])
+
+        with _tracked_player(cmd, stdin=subprocess.PIPE) as proc:
+            # Feed from a thread so a stop can terminate say mid-write
+            threading.Thread(
+                target=_feed_stdin, args=(proc, text.encode("utf-8")), daemon=True
+            ).start()
+            # Sleep until say exits or the stop signal appears
+            _wait_proc_or_stop(proc)
+
+        for queued in batch:
+            finish_speech(queued)
+        _drain_if_stopped()
+
+
+def _drain_if_stopped():
+    """After playback: if a stop cut it short, drop the rest of the queue too."""
+    if _playback_stopped.is_set():
+        _playback_stopped.clear()
+        logger.debug("Playback stopped, clearing queue")
+        drain_speech_queue()
+
+
+def _speak_neural(clean_text: str, voice: str | None) -> bool:
+    """Try the configured neural backends in order. Returns True once one has spoken."""
+    # Try Kokoro MLX TTS first (if configured)
+    if kokoro_available():
+        if speak_with_kokoro(clean_text, blocking=True, voice=voice):
+            return True
+        # Fall through to other backends if Kokoro fails
 
-        with process_lock:
-            current_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-
-        # Poll for completion while checking stop signal
-        while current_process.poll() is None:
-            if check_and_clear_stop_signal():
-                current_process.terminate()
-                break
-            time.sleep(0.05)  # Check every 50ms
+    # Try Google Cloud TTS (if configured)
+    if google_tts_available():
+        if speak_with_google(clean_text, blocking=True):
+            return True
+        # Fall through to other backends if Google fails
 
-        with process_lock:
-            current_process = None
+    # Try Chatterbox for neural TTS (if enabled)
+    if USE_CHATTERBOX and chatterbox_available():
+        if speak_with_chatterbox(clean_text, blocking=True):
+            return True
+        # Fall through to macOS voice if Chatterbox fails
 
-        speech_queue.task_done()
+    return False
 
 
 _worker_lock = threading.Lock()
@@ -520,9 +1307,86 @@ def ensure_worker_running():
         else:
             logger.debug(f"Worker thread alive: {worker_thread.is_alive()}")
 
+        if USE_CHATTERBOX:
+            ensure_health_pinger_running()
+
+        if not _stop_listener_attempted:
+            _start_stop_listener()
+
+        if not _prewarm_started:
+            start_google_prewarm()
+
+        if not _kokoro_warmup_started and TTS_BACKEND == "kokoro":
+            start_kokoro_warmup()
+
+
+def ensure_health_pinger_running():
+    """Start the Chatterbox health pinger if it isn't running. Caller holds _worker_lock."""
+    global _health_thread
+    if _health_thread is None or not _health_thread.is_alive():
+        logger.info("Starting Chatterbox health pinger")
+        _health_thread = threading.Thread(target=_health_pinger, daemon=True, name="chatterbox-health")
+        _health_thread.start()
+
+
+def start_google_prewarm():
+    """Prewarm the Google TTS cache once, off-thread. Caller holds _worker_lock."""
+    global _prewarm_started
+    _prewarm_started = True
+    if google_tts_available() and GOOGLE_TTS_CACHE_MAX_MB > 0 and GOOGLE_TTS_PREWARM:
+        threading.Thread(target=_prewarm_google_cache, daemon=True, name="google-prewarm").start()
+
+
+def start_kokoro_warmup():
+    """Warm up Kokoro once, off-thread. Caller holds _worker_lock."""
+    global _kokoro_warmup_started
+    _kokoro_warmup_started = True
+    threading.Thread(target=_warm_kokoro, daemon=True, name="kokoro-warmup").start()
+
 
 # Trailing silence in milliseconds to prevent last word from being cut off
 TRAILING_SILENCE_MS = 300
+_SILENCE_SUFFIX = f" [[slnc {TRAILING_SILENCE_MS}]]"
+
+
+@functools.lru_cache(maxsize=128)
+def _classify_voice(voice: str | None) -> tuple[bool, str | None]:
+    """
+    Map a requested voice to (use_neural, voice passed to the worker).
+    Callers reuse a handful of voices, so the result is memoized.
+    """
+    # Determine if we should use neural TTS (default backend or explicit request)
+    # Check if voice is a Kokoro voice ID (2-character prefix like af_, bf_, ff_, etc.)
+    is_kokoro_voice = bool(voice) and len(voice) >= 3 and voice[1] in "mf" and voice[2] == "_"
+    use_neural = voice is None or voice.lower() in ("chatterbox", "google", "kokoro") or is_kokoro_voice
+    if use_neural:
+        # Pass Kokoro voice ID if specified
+        return True, voice if is_kokoro_voice else None
+    return False, voice
+
+
+def _enqueue(text: str, voice: str | None, speed: float,
+             done: threading.Event | None = None) -> str | None:
+    """
+    Queue an utterance for the speech worker (shared by speak/speak_and_wait).
+    Returns the backend name reported back to the caller, or None if the
+    utterance duplicated the last queued one (TTS_DEDUP).
+    """
+    ensure_worker_running()
+    rate = int(speed * 175)  # 175 words/min = normal speed
+    use_neural, queued_voice = _classify_voice(voice)
+
+    # Add trailing silence so the last word is fully heard (macOS say only;
+    # the worker adds it itself if a neural item falls back to say)
+    if not use_neural:
+        text += _SILENCE_SUFFIX
+
+    if not enqueue_speech(text, queued_voice, rate, use_neural, done):
+        logger.debug("Duplicate of the last queued message, not queued")
+        return None
+    logger.debug(f"Queued message, queue size: {len(speech_deque)}")
+
+    return TTS_BACKEND if use_neural else voice
 
 
 @mcp.tool()
@@ -530,29 +1394,18 @@ def speak(text: str, voice: str | None = None, speed: float = 1.0) -> str:
     """Queue TTS without waiting. Args: text, voice, speed (1.0=normal)"""
     logger.info(f"speak() called: {text[:50]}...")
 
+    # Nothing to say: don't queue a silent utterance (or a paid API call)
+    if not text.strip():
+        return "Skipped (empty)"
+
     # Check if barge-in is active - if so, skip this message entirely
     if BARGE_IN_SIGNAL_FILE.exists():
         logger.info("Barge-in active (signal file exists), skipping speak")
         return "Skipped (barge-in active)"
 
-    ensure_worker_running()
-    rate = int(speed * 175)  # 175 words/min = normal speed
-
-    # Determine if we should use neural TTS (default backend or explicit request)
-    # Check if voice is a Kokoro voice ID (2-character prefix like af_, bf_, ff_, etc.)
-    is_kokoro_voice = voice and len(voice) >= 3 and voice[1] in "mf" and voice[2] == "_"
-    use_neural = voice is None or voice.lower() in ("chatterbox", "google", "kokoro") or is_kokoro_voice
-    macos_voice = None if use_neural else voice
-
-    # Add trailing silence so the last word is fully heard (for macOS voices)
-    text_with_silence = f"{text} [[slnc {TRAILING_SILENCE_MS}]]"
-
-    # Pass Kokoro voice ID if specified
-    neural_voice = voice if is_kokoro_voice else None
-    speech_queue.put((text_with_silence, neural_voice if use_neural else macos_voice, rate, use_neural))
-    logger.debug(f"Queued message, queue size: {speech_queue.qsize()}")
-
-    backend_name = TTS_BACKEND if use_neural else voice
+    backend_name = _enqueue(text, voice, speed)
+    if backend_name is None:
+        return "Skipped (duplicate already queued)"
     return f"Queued ({backend_name})"
 
 
@@ -561,6 +1414,10 @@ def speak_and_wait(text: str, voice: str | None = None, speed: float = 1.1) -> s
     """Speak and wait for completion. Args: text, voice, speed (1.1=default)"""
     logger.info(f"speak_and_wait() called: {text[:50]}...")
 
+    # Nothing to say: don't queue a silent utterance (or a paid API call)
+    if not text.strip():
+        return "Skipped (empty)"
+
     # Check if barge-in is active - if so, skip this message entirely
     # The barge-in file is created by stop_speaking/force_stop_tts
     # and cleared by claude-listen when transcription is ready
@@ -571,27 +1428,15 @@ def speak_and_wait(text: str, voice: str | None = None, speed: float = 1.1) -> s
     # Clear any stale stop signal from previous sessions
     check_and_clear_stop_signal()
 
-    ensure_worker_running()
-    rate = int(speed * 175)  # 175 words/min = normal speed
-
-    # Determine if we should use neural TTS (default backend or explicit request)
-    # Check if voice is a Kokoro voice ID (2-character prefix like af_, bf_, ff_, etc.)
-    is_kokoro_voice = voice and len(voice) >= 3 and voice[1] in "mf" and voice[2] == "_"
-    use_neural = voice is None or voice.lower() in ("chatterbox", "google", "kokoro") or is_kokoro_voice
-    macos_voice = None if use_neural else voice
-
-    # Add trailing silence so the last word is fully heard (for macOS voices)
-    text_with_silence = f"{text} [[slnc {TRAILING_SILENCE_MS}]]"
-
-    # Pass Kokoro voice ID if specified
-    neural_voice = voice if is_kokoro_voice else None
-    speech_queue.put((text_with_silence, neural_voice if use_neural else macos_voice, rate, use_neural))
-    logger.debug(f"Queued message, queue size: {speech_queue.qsize()}")
+    # The queue is FIFO with a single consumer, so once our item is done
+    # everything queued before it is done too
+    done = threading.Event()
+    backend_name = _enqueue(text, voice, speed, done)
 
     # Wait for the queue to be processed
-    logger.debug("Waiting for queue to empty...")
-    speech_queue.join()
-    logger.debug("Queue empty, speech completed")
+    logger.debug("Waiting for our message to be spoken...")
+    done.wait()
+    logger.debug("Message done, speech completed")
 
     # Clear any segments recorded during TTS (feedback loop prevention)
     clear_listen_segments()
@@ -603,15 +1448,12 @@ def speak_and_wait(text: str, voice: str | None = None, speed: float = 1.1) -> s
     signal_tts_complete()
     logger.debug("TTS complete signal sent")
 
-    backend_name = TTS_BACKEND if use_neural else voice
     return f"Speech completed ({backend_name})"
 
 
 @mcp.tool()
 def stop_speaking() -> str:
     """Stop current TTS and clear queue."""
-    global current_process, current_afplay
-
     # Set barge-in signal - this prevents subsequent speak_and_wait calls from playing
     # The signal is cleared by claude-listen when transcription is ready
     BARGE_IN_SIGNAL_FILE.touch()
@@ -619,40 +1461,19 @@ def stop_speaking() -> str:
 
     # Set stop signal FIRST - ensures speech_worker skips any item it already dequeued
     # This prevents race condition where worker got next item before we clear queue
-    STOP_SIGNAL_FILE.touch()
+    raise_stop_signal()
     logger.info("Stop signal set, clearing queue...")
 
-    # Clear the queue - MUST call task_done() for each item to unblock join()
-    items_cleared = 0
-    while not speech_queue.empty():
-        try:
-            speech_queue.get_nowait()
-            speech_queue.task_done()  # Critical: unblocks any waiting join()
-            items_cleared += 1
-        except Empty:
-            break
+    # Clear the queue (dropped items are finished, so speak_and_wait unblocks)
+    items_cleared = drain_speech_queue()
 
     # Stop Chatterbox playback (only if enabled)
     if USE_CHATTERBOX:
         stop_chatterbox()
 
-    # Stop Kokoro playback (if enabled)
-    if TTS_BACKEND == "kokoro":
-        stop_kokoro()
-
-    stopped = False
-    with process_lock:
-        # Stop Google TTS afplay process
-        if current_afplay and current_afplay.poll() is None:
-            current_afplay.terminate()
-            current_afplay = None
-            stopped = True
-
-        # Stop macOS say process
-        if current_process and current_process.poll() is None:
-            current_process.terminate()
-            current_process = None
-            stopped = True
+    # Stop the say/afplay process the worker is playing (any backend).
+    # In-process (sounddevice) playback ends on the stop signal raised above.
+    stopped = terminate_players() or _pcm_active.is_set()
 
     if stopped:
         return f"Stopped. {items_cleared} message(s) cleared from queue."
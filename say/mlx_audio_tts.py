@@ -23,13 +23,26 @@ Usage:
     tts.play(audio_array, sr)
 """
 
+import itertools
+import logging
+import os
+import struct
 import subprocess
+import sys
 import tempfile
+import threading
+import wave
+from collections import OrderedDict
 from pathlib import Path
+from types import MappingProxyType
+from weakref import WeakValueDictionary
 from typing import Optional, Tuple
 import numpy as np
 
 try:
+    import mlx.core as mx
+    import mlx.nn as nn
+    from mlx.utils import tree_map
     from mlx_audio.tts.generate import generate_audio
     from mlx_audio.tts.utils import load_model
     try:
@@ -42,6 +55,58 @@ except ImportError:
     HAS_MLX_AUDIO = False
     KokoroPipeline = None
 
+try:
+    from shared.coordination import check_stop_signal, get_coordinator
+except ImportError:
+    # Standalone use outside the claude-say tree: no stop coordination
+    check_stop_signal = None
+    get_coordinator = None
+
+
+logger = logging.getLogger("mlx-audio-tts")
+
+# Loaded models shared by every MLXAudioTTS instance, keyed by
+# (model_id, dtype, quant_bits); dropped once no instance holds them
+_MODEL_CACHE: WeakValueDictionary = WeakValueDictionary()
+
+
+def to_int16(audio) -> np.ndarray:
+    """Convert float samples in [-1, 1] to 16-bit PCM, clipping overs."""
+    # Scale into one float32 scratch buffer and clip it in place: a single
+    # temporary besides the int16 result
+    pcm = np.multiply(audio, np.float32(32767.0), dtype=np.float32)
+    np.clip(pcm, -32768, 32767, out=pcm)
+    return pcm.astype(np.int16)
+
+
+def write_wav(path, audio, sample_rate: int = 24000) -> None:
+    """
+    Write mono float audio as a 16-bit WAV file.
+
+    Uses the stdlib wave module: no soundfile import for the plain WAV
+    the players need.
+    """
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(to_int16(audio).tobytes())
+
+
+def _wav_stream_header(sample_rate: int) -> bytes:
+    """
+    WAV header for 16-bit mono PCM of unknown length.
+
+    The RIFF and data sizes are set to the maximum so the player reads
+    until the stream is closed.
+    """
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 0xFFFFFFFF, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+        b"data", 0xFFFFFFFF,
+    )
+
 
 class MLXAudioTTS:
     """MLX-Audio Text-to-Speech backend with multilingual Kokoro support."""
@@ -148,6 +213,14 @@ class MLXAudioTTS:
     VOICES = {}
     for lang_voices in VOICES_BY_LANGUAGE.values():
         VOICES.update(lang_voices)
+    del lang_voices
+
+    # Read-only views: the tables are shared by every instance
+    VOICES = MappingProxyType(VOICES)
+    VOICES_BY_LANGUAGE = MappingProxyType({
+        lang: MappingProxyType(lang_voices)
+        for lang, lang_voices in VOICES_BY_LANGUAGE.items()
+    })
 
     # Default voices per language
     DEFAULT_VOICES = {
@@ -162,12 +235,20 @@ class MLXAudioTTS:
         "z": "zf_xiaoxiao",
     }
 
+    # Synthesized audio kept for short, repeated utterances ("Done.", "Yes.")
+    AUDIO_CACHE_SIZE = 128
+    AUDIO_CACHE_MAX_CHARS = 80
+
     def __init__(
         self,
         voice: str = "af_heart",
         speed: float = 1.0,
         model_id: str = "prince-canuma/Kokoro-82M",
         cache_model: bool = True,
+        quant_bits: int = 0,
+        dtype: Optional[str] = None,
+        warmup: bool = True,
+        pipe_playback: bool = False,
     ):
         """
         Initialize MLX-Audio TTS backend.
@@ -177,6 +258,19 @@ class MLXAudioTTS:
             speed: Speaking speed 0.5-2.0 (default: 1.0)
             model_id: HuggingFace model ID (default: Kokoro-82M)
             cache_model: Keep model in memory for faster synthesis (default: True)
+            quant_bits: Quantize Linear layers to 4 or 8 bits at load (0 = off).
+                Faster synthesis on the memory-bound decoder at a small,
+                usually inaudible, quality cost; 4 bits trades the most.
+            dtype: Cast float weights to "float16", "bfloat16" or "float32" at
+                load (default: keep the checkpoint's dtype). Half precision
+                halves weight traffic on the GPU; ignored without Metal.
+            warmup: Run a throwaway synthesis when a language pipeline is
+                built, so Metal kernels are compiled before the first real
+                call (default: True)
+            pipe_playback: Stream audio to afplay over /dev/stdin while it is
+                synthesized instead of playing a temp WAV file once it is
+                complete. Only for setups verified to play from a pipe; after
+                a failure the instance falls back to temp files (default: False)
         """
         if not HAS_MLX_AUDIO:
             raise ImportError(
@@ -191,13 +285,27 @@ class MLXAudioTTS:
         if not (0.5 <= speed <= 2.0):
             raise ValueError(f"Speed must be between 0.5 and 2.0, got {speed}")
 
+        if quant_bits not in (0, 4, 8):
+            raise ValueError(f"quant_bits must be 0, 4 or 8, got {quant_bits}")
+
+        if dtype not in (None, "float16", "bfloat16", "float32"):
+            raise ValueError(
+                f"dtype must be float16, bfloat16 or float32, got {dtype}"
+            )
+
         self.voice = voice
         self.speed = speed
         self.model_id = model_id
         self.cache_model = cache_model
+        self.quant_bits = quant_bits
+        self.dtype = dtype
+        self.warmup = warmup
+        self.pipe_playback = pipe_playback
         self._model = None
-        self._pipeline = None
-        self._current_lang = None
+        self._pipelines = {}  # lang_code -> KokoroPipeline, all sharing self._model
+        self._tmp_wav: Optional[Path] = None  # reused by every play() call
+        self._audio_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+        self._audio_cache_lock = threading.Lock()
 
     @staticmethod
     def get_language_from_voice(voice_id: str) -> str:
@@ -207,20 +315,97 @@ class MLXAudioTTS:
         return voice_id[0]
 
     def _load_model(self, lang_code: str = None):
-        """Load and cache the model for the specified language."""
+        """Load the model once and cache a pipeline per language."""
         if lang_code is None:
             lang_code = self.get_language_from_voice(self.voice)
 
-        # Reload if language changed
-        if self._pipeline is None or self._current_lang != lang_code:
-            self._model = load_model(self.model_id)
-            self._pipeline = KokoroPipeline(
+        pipeline = self._pipelines.get(lang_code)
+        if pipeline is None:
+            if self._model is None:
+                key = (self.model_id, self.dtype, self.quant_bits)
+                model = _MODEL_CACHE.get(key)
+                if model is None:
+                    model = load_model(self.model_id)
+                    if self.dtype and mx.metal.is_available():
+                        self._cast(model)
+                    if self.quant_bits:
+                        self._quantize(model)
+                    _MODEL_CACHE[key] = model
+                self._model = model
+            # Switching languages only builds a pipeline; the model is shared
+            pipeline = KokoroPipeline(
                 lang_code=lang_code,
                 model=self._model,
                 repo_id=self.model_id,
             )
-            self._current_lang = lang_code
-        return self._pipeline
+            self._pipelines[lang_code] = pipeline
+            if self.warmup:
+                self._warmup(pipeline, lang_code)
+        return pipeline
+
+    def _warmup(self, pipeline, lang_code: str):
+        """Run one throwaway forward pass so kernels are compiled up front."""
+        if self.get_language_from_voice(self.voice) == lang_code:
+            voice = self.voice
+        else:
+            voice = self.DEFAULT_VOICES.get(lang_code, "af_heart")
+        for _, _, audio in pipeline(
+            "Ready.", voice=voice, speed=self.speed, split_pattern=r'\n+'
+        ):
+            if isinstance(audio, mx.array):
+                mx.eval(audio)
+            break
+
+    def preload(self):
+        """Load the model and the pipeline for the instance voice now."""
+        self._load_model()
+
+    def _cast(self, model):
+        """Cast floating-point parameters to self.dtype; integer buffers are kept."""
+        dtype = getattr(mx, self.dtype)
+        model.update(tree_map(
+            lambda p: p.astype(dtype) if mx.issubdtype(p.dtype, mx.floating) else p,
+            model.parameters(),
+        ))
+
+    def _quantize(self, model, group_size: int = 64):
+        """Quantize Linear weights in place; norms, embeddings and convs stay full precision."""
+        nn.quantize(
+            model,
+            group_size=group_size,
+            bits=self.quant_bits,
+            class_predicate=lambda _, module: (
+                isinstance(module, nn.Linear)
+                and module.weight.shape[-1] % group_size == 0
+            ),
+        )
+
+    def _iter_audio(self, text: str, voice: str = None):
+        """Yield 1-D MLX audio chunks as the pipeline produces them."""
+        voice = voice or self.voice
+        lang_code = self.get_language_from_voice(voice)
+        pipeline = self._load_model(lang_code)
+
+        for _, _, audio in pipeline(
+            text, voice=voice, speed=self.speed, split_pattern=r'\n+'
+        ):
+            # audio is (1, num_samples) array
+            yield audio[0]
+
+    def synthesize_mlx(self, text: str, voice: str = None) -> Tuple["mx.array", int]:
+        """
+        Synthesize text to speech, keeping the result as an MLX array.
+
+        Same as synthesize() but skips the NumPy conversion, for callers
+        that keep processing on the MLX side.
+
+        Returns:
+            Tuple of (audio, sample_rate)
+        """
+        audio_chunks = list(self._iter_audio(text, voice))
+        if not audio_chunks:
+            raise RuntimeError(f"Failed to synthesize: {text}")
+        return mx.concatenate(audio_chunks), 24000
 
     def synthesize(self, text: str, voice: str = None) -> Tuple[np.ndarray, int]:
         """
@@ -235,25 +420,50 @@ class MLXAudioTTS:
             audio_array: numpy array of audio samples
             sample_rate: 24000 Hz for Kokoro-82M
         """
-        voice = voice or self.voice
-        lang_code = self.get_language_from_voice(voice)
-        pipeline = self._load_model(lang_code)
+        # Short utterances repeat a lot: serve them without G2P or inference
+        cacheable = len(text) <= self.AUDIO_CACHE_MAX_CHARS
+        if cacheable:
+            key = (text, voice or self.voice, self.speed)
+            with self._audio_cache_lock:
+                cached = self._audio_cache.get(key)
+                if cached is not None:
+                    self._audio_cache.move_to_end(key)
+                    return cached, 24000
+
+        audio_array = self._synthesize_array(text, voice)
+
+        if cacheable:
+            audio_array.flags.writeable = False  # shared with later callers
+            with self._audio_cache_lock:
+                self._audio_cache[key] = audio_array
+                if len(self._audio_cache) > self.AUDIO_CACHE_SIZE:
+                    self._audio_cache.popitem(last=False)
+        return audio_array, 24000
 
+    def _synthesize_array(self, text: str, voice: str = None) -> np.ndarray:
+        """Run the pipeline and join its chunks into one float32 array."""
         # Collect all audio chunks
-        audio_chunks = []
-        for _, _, audio in pipeline(
-            text, voice=voice, speed=self.speed, split_pattern=r'\n+'
-        ):
-            # audio is (1, num_samples) array
-            audio_chunks.append(audio[0])
-
+        audio_chunks = list(self._iter_audio(text, voice))
         if not audio_chunks:
             raise RuntimeError(f"Failed to synthesize: {text}")
 
-        # Concatenate all chunks
-        audio_array = np.concatenate(audio_chunks)
+        if isinstance(audio_chunks[0], mx.array):
+            # Join on the MLX side and materialize once, instead of one
+            # device-to-host conversion per chunk
+            joined = mx.concatenate(audio_chunks)
+            mx.eval(joined)
+            return np.asarray(joined, dtype=np.float32)
 
-        return audio_array, 24000
+        # Pipeline yielded NumPy: join into one preallocated buffer, each
+        # chunk copied exactly once, with no intermediate per-chunk arrays
+        audio_array = np.empty(sum(chunk.shape[0] for chunk in audio_chunks), dtype=np.float32)
+        offset = 0
+        for chunk in audio_chunks:
+            n = chunk.shape[0]
+            audio_array[offset:offset + n] = chunk
+            offset += n
+
+        return audio_array
 
     def synthesize_to_file(
         self, text: str, output_path: Path, format: str = "wav", voice: str = None
@@ -270,10 +480,29 @@ class MLXAudioTTS:
         Returns:
             Path to generated file
         """
-        import soundfile as sf
-
-        audio_array, sr = self.synthesize(text, voice)
-        sf.write(output_path, audio_array, sr)
+        # Stream chunks into the file as they are synthesized: the full
+        # utterance is never joined in memory
+        audio_chunks = self._iter_audio(text, voice)
+        first = next(audio_chunks, None)
+        if first is None:
+            raise RuntimeError(f"Failed to synthesize: {text}")
+        audio_chunks = itertools.chain([first], audio_chunks)
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if Path(output_path).suffix.lower() == ".wav":
+            with wave.open(str(output_path), "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(24000)
+                for chunk in audio_chunks:
+                    w.writeframes(to_int16(chunk).tobytes())
+        else:
+            # Other containers (flac, ogg...) still need libsndfile
+            import soundfile as sf
+
+            with sf.SoundFile(output_path, "w", samplerate=24000, channels=1) as f:
+                for chunk in audio_chunks:
+                    f.write(np.asarray(chunk))
 
         return output_path
 
@@ -285,16 +514,130 @@ class MLXAudioTTS:
             audio_array: numpy array of audio samples
             sample_rate: sample rate (default: 24000)
         """
-        import soundfile as sf
+        # Playback is blocking, so one file per instance is overwritten in
+        # place instead of leaving a new temp file behind on every call
+        if self._tmp_wav is None:
+            fd, path = tempfile.mkstemp(prefix="mlx_tts_", suffix=".wav")
+            os.close(fd)
+            self._tmp_wav = Path(path)
+        write_wav(self._tmp_wav, audio_array, sample_rate)
+        subprocess.run(["afplay", str(self._tmp_wav)], check=True)
+
+    @staticmethod
+    def _stream_to_player(proc: subprocess.Popen, audio_chunks, unsent: list) -> bool:
+        """
+        Feed audio chunks to afplay's stdin as int16 PCM while they are synthesized.
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            sf.write(f.name, audio_array, sample_rate)
-            subprocess.run(["afplay", f.name], check=True)
+        A chunk afplay did not take is appended to unsent, so a caller can
+        play the rest from a file without repeating what was already heard.
+
+        Returns:
+            True unless afplay failed (a stop request counts as success)
+        """
+        coordinator = get_coordinator() if get_coordinator is not None else None
+        if coordinator is not None:
+            coordinator.start_speaking(proc=proc)
+        stopped = False
+        try:
+            for chunk in audio_chunks:
+                if check_stop_signal is not None and check_stop_signal():
+                    stopped = True
+                    proc.terminate()
+                    break
+                pcm = to_int16(chunk)
+                try:
+                    proc.stdin.write(pcm.tobytes())
+                except BrokenPipeError:
+                    unsent.append(pcm)
+                    raise
+        except BrokenPipeError:
+            # afplay exited early: killed from outside (stop_speaking,
+            # barge-in) or failed; its exit status below tells which
+            pass
+        finally:
+            # Also reached when synthesis or the write fails mid-stream: the
+            # coordinator must not keep reporting this player as speaking
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            proc.wait()
+            if coordinator is not None:
+                coordinator.stop_speaking()
+        # Negative: terminated by a signal, i.e. stopped from outside
+        return stopped or proc.returncode <= 0
+
+    @staticmethod
+    def _play_wav_file(pcm_chunks) -> bool:
+        """
+        Play int16 PCM chunks from a temp WAV file (waits for playback).
+
+        Returns:
+            True unless afplay failed (a stop request counts as success)
+        """
+        fd, path = tempfile.mkstemp(prefix="mlx_tts_", suffix=".wav")
+        os.close(fd)
+        try:
+            with wave.open(path, "wb") as w:
+                w.setnchannels(1)
+                w.setsampwidth(2)
+                w.setframerate(24000)
+                for pcm in pcm_chunks:
+                    w.writeframes(pcm.tobytes())
+
+            proc = subprocess.Popen(
+                ["afplay", path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            coordinator = get_coordinator() if get_coordinator is not None else None
+            if coordinator is not None:
+                coordinator.start_speaking(proc=proc)
+            try:
+                proc.wait()
+            finally:
+                if coordinator is not None:
+                    coordinator.stop_speaking()
+            return proc.returncode <= 0
+        finally:
+            os.unlink(path)
+
+    def _play_chunks(self, audio_chunks) -> bool:
+        """
+        Play audio chunks from a temp WAV file, or stream them to afplay.
+
+        Streaming is opt-in (pipe_playback). If afplay fails on the pipe,
+        the audio it did not take is played from a temp WAV file and later
+        calls go straight to the file path.
+        """
+        if self.pipe_playback:
+            proc = subprocess.Popen(
+                ["afplay", "/dev/stdin"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            unsent = []
+            try:
+                proc.stdin.write(_wav_stream_header(24000))
+            except BrokenPipeError:
+                pass  # Exited already; _stream_to_player sees the status
+            if self._stream_to_player(proc, audio_chunks, unsent):
+                return True
+            logger.warning("afplay could not play from a pipe, using temp files")
+            self.pipe_playback = False
+            audio_chunks = itertools.chain(unsent, map(to_int16, audio_chunks))
+        else:
+            audio_chunks = map(to_int16, audio_chunks)
+        return self._play_wav_file(audio_chunks)
 
     def speak(self, text: str, voice: str = None, blocking: bool = True) -> bool:
         """
         Synthesize and play text.
 
+        Plays from a temp WAV file once synthesis is done; with pipe_playback
+        it starts at the first chunk and the rest is streamed to afplay.
+
         Args:
             text: Text to speak
             voice: Optional voice override
@@ -303,21 +646,20 @@ class MLXAudioTTS:
         Returns:
             True if successful
         """
-        import soundfile as sf
-
         try:
-            audio_array, sr = self.synthesize(text, voice)
-
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                sf.write(f.name, audio_array, sr)
-                if blocking:
-                    subprocess.run(["afplay", f.name], check=True)
-                else:
-                    subprocess.Popen(
-                        ["afplay", f.name],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
+            audio_chunks = self._iter_audio(text, voice)
+            first = next(audio_chunks, None)
+            if first is None:
+                raise RuntimeError(f"Failed to synthesize: {text}")
+            audio_chunks = itertools.chain([first], audio_chunks)
+
+            if blocking:
+                return self._play_chunks(audio_chunks)
+            threading.Thread(
+                target=self._play_chunks,
+                args=(audio_chunks,),
+                daemon=True,
+            ).start()
             return True
         except Exception as e:
             print(f"Kokoro TTS error: {e}")
@@ -326,8 +668,12 @@ class MLXAudioTTS:
     def unload_model(self):
         """Unload model from memory to free RAM."""
         self._model = None
-        self._pipeline = None
-        self._current_lang = None
+        self._pipelines.clear()
+        with self._audio_cache_lock:
+            self._audio_cache.clear()
+        if self._tmp_wav is not None:
+            self._tmp_wav.unlink(missing_ok=True)
+            self._tmp_wav = None
 
     @staticmethod
     def get_voice_name(voice_id: str) -> str:
@@ -363,9 +709,7 @@ class MLXAudioTTS:
 # Quick test
 if __name__ == "__main__":
     if not HAS_MLX_AUDIO:
-        print("Installing mlx-audio...")
-        import subprocess
-        subprocess.run(["pip", "install", "mlx-audio"], check=True)
+        sys.exit("mlx-audio is not installed. Install with: pip install mlx-audio")
 
     print("Available languages:")
     for code, name in MLXAudioTTS.list_languages().items():
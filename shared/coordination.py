@@ -3,7 +3,13 @@ Coordination module for claude-say and claude-listen.
 Handles communication between TTS and STT servers.
 """
 
+import glob
+import select
+import signal
+import socket
 import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 import os
@@ -33,48 +39,119 @@ STOP_SIGNAL_FILE = Path("/tmp/claude-voice-stop")
 TTS_COMPLETE_SIGNAL_FILE = Path("/tmp/claude-tts-complete")
 BARGE_IN_SIGNAL_FILE = Path("/tmp/claude-barge-in")
 
+# Plain-string forms for the hot checks: os calls skip pathlib's wrapping
+_STOP_SIGNAL_PATH = str(STOP_SIGNAL_FILE)
+_TTS_COMPLETE_SIGNAL_PATH = str(TTS_COMPLETE_SIGNAL_FILE)
+_BARGE_IN_SIGNAL_PATH = str(BARGE_IN_SIGNAL_FILE)
+
+
+# Per-process stop sockets bound by claude-say servers (see mcp_server.py)
+STOP_SIGNAL_SOCKET_GLOB = "/tmp/claude-voice-stop.*.sock"
+
+# In-process stop signal: checked before the signal file, so a stop raised
+# in this process costs no syscall to detect
+_stop_event = threading.Event()
+
+# In-process TTS-complete signal: wakes a waiter in the same process at once,
+# even where only the polling fallback is available
+_tts_complete_event = threading.Event()
+
+
+def clear_stale_signals() -> None:
+    """
+    Drop stop / TTS-complete files left behind by a previous run that crashed.
+
+    Called once at claude-listen startup (it sends stops and consumes
+    TTS-complete). Not run on import: a say server starting for another
+    session would delete a signal that listen has not consumed yet.
+    """
+    for path in (_STOP_SIGNAL_PATH, _TTS_COMPLETE_SIGNAL_PATH):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def send_stop_datagram() -> bool:
+    """
+    Send a stop datagram to every listening claude-say server.
+
+    Stale sockets left by dead servers are removed along the way.
+
+    Returns:
+        True if at least one server received the signal
+    """
+    sent = False
+    for path in glob.glob(STOP_SIGNAL_SOCKET_GLOB):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            try:
+                sock.sendto(b"s", path)
+                sent = True
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Nobody bound: the server exited without cleaning up
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+            except OSError as e:
+                log.debug(f"Stop datagram to {path} failed: {e}")
+    return sent
+
+
+def _send_stop_signal() -> bool:
+    """
+    Stop datagram if a server listens, else the legacy signal file.
+
+    Returns:
+        True if a server took the datagram (its listener ends playback itself)
+    """
+    _stop_event.set()
+    if send_stop_datagram():
+        log.info("Stop datagram sent")
+        return True
+    STOP_SIGNAL_FILE.touch()
+    log.info("Stop signal file created (no stop socket listening)")
+    return False
+
 
 def force_stop_tts() -> bool:
     """
     Force stop all TTS playback immediately.
 
-    Kills say/afplay processes directly (immediate) + sets signal file (clears queue).
-    This is the preferred method for barge-in as it's instantaneous.
+    Sends the stop signal (clears queue). A claude-say server listening on
+    a stop socket terminates its own players on receipt; otherwise say/afplay
+    processes are killed directly (immediate). This is the preferred method
+    for barge-in as it's instantaneous.
 
     Returns:
         True if any process was killed or signal was sent
     """
     log.info("force_stop_tts() called - killing TTS processes")
 
-    killed = False
-
-    # Kill macOS say process
-    try:
-        result = subprocess.run(["pkill", "-x", "say"], capture_output=True)
-        if result.returncode == 0:
-            killed = True
-            log.info("Killed 'say' process")
-    except Exception as e:
-        log.debug(f"Error killing say: {e}")
-
-    # Kill afplay process (used by Kokoro/Google TTS)
-    try:
-        result = subprocess.run(["pkill", "-x", "afplay"], capture_output=True)
-        if result.returncode == 0:
-            killed = True
-            log.info("Killed 'afplay' process")
-    except Exception as e:
-        log.debug(f"Error killing afplay: {e}")
-
     # Set barge-in signal to prevent subsequent speak_and_wait calls
     BARGE_IN_SIGNAL_FILE.touch()
     log.info("Barge-in signal file created (subsequent speak_and_wait will skip)")
 
-    # Also set signal file to clear the queue in speech_worker
-    STOP_SIGNAL_FILE.touch()
-    log.info("Stop signal file created (queue will be cleared)")
+    # Also signal speech_worker to clear the queue. The datagram is
+    # asynchronous: killing the player here could wake the worker before its
+    # listener has set the stop, and the worker would take that for a normal
+    # end and play the next item. The listener sets the stop, then
+    # terminates the players, so there is nothing left to kill.
+    if _send_stop_signal():
+        return True
+
+    # The signal file was written before this kill, so a worker woken by
+    # its player's exit already sees it. One fresh process snapshot finds
+    # both macOS say and afplay (used by Kokoro/Google TTS)
+    for name, pids in _tts_process_pids(max_age=0).items():
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                log.info(f"Killed '{name}' process {pid}")
+            except OSError as e:
+                log.debug(f"Error killing {name} ({pid}): {e}")
 
-    return killed or True  # Always return True since signal file is set
+    return True  # Always return True since signal file is set
 
 
 def signal_stop_speaking() -> bool:
@@ -90,6 +167,7 @@ def signal_stop_speaking() -> bool:
         True if signal was sent successfully
     """
     log.info("signal_stop_speaking() called")
+    _stop_event.set()
 
     try:
         # Method 1: Use the MCP tool directly if in same process
@@ -109,10 +187,8 @@ def signal_stop_speaking() -> bool:
         except ImportError as e:
             log.debug(f"Direct import failed (expected in separate processes): {e}")
 
-        # Method 2: Use signal file
-        log.info(f"Using signal file method: touching {STOP_SIGNAL_FILE}")
-        STOP_SIGNAL_FILE.touch()
-        log.info("Signal file created successfully")
+        # Method 2: Stop socket, or signal file for servers without one
+        _send_stop_signal()
         return True
 
     except Exception as e:
@@ -129,61 +205,97 @@ def check_stop_signal() -> bool:
     Returns:
         True if stop signal is present
     """
-    if STOP_SIGNAL_FILE.exists():
-        log.info("Stop signal detected! Clearing signal file and returning True")
-        STOP_SIGNAL_FILE.unlink()  # Clear the signal
+    if _stop_event.is_set():
+        _stop_event.clear()
+        log.info("Stop signal detected (in-process)")
         return True
-    return False
+    try:
+        os.unlink(_STOP_SIGNAL_PATH)  # Detect and clear in one syscall
+    except FileNotFoundError:
+        return False
+    log.info("Stop signal detected! Cleared signal file and returning True")
+    return True
+
+
+class _ProcessSnapshot:
+    """Last ps result; slots keep the per-chunk reads to plain attribute loads."""
+
+    __slots__ = ("pids", "timestamp")
+
+    def __init__(self):
+        self.pids: dict[str, list[int]] = {}
+        self.timestamp = float("-inf")
+
+
+# One ps run serves every is_speaking()/force_stop_tts() call in its window,
+# instead of a pgrep or pkill per call
+_process_snapshot = _ProcessSnapshot()
+_PROCESS_SNAPSHOT_TTL = 0.3  # Refresh at most every 300ms
+_TTS_PROCESS_NAMES = ("say", "afplay")
+
+
+def _tts_process_pids(max_age: float = _PROCESS_SNAPSHOT_TTL) -> dict[str, list[int]]:
+    """
+    PIDs of running say/afplay processes, by name.
 
+    Served from a shared snapshot while it is younger than max_age
+    seconds (0 forces a fresh one).
+    """
+    snapshot = _process_snapshot
+    now = time.monotonic()
+    if now - snapshot.timestamp < max_age:
+        return snapshot.pids
 
-# Cache for is_speaking() to avoid spawning subprocess on every audio chunk
-_is_speaking_cache = {"value": False, "timestamp": 0.0}
-_IS_SPEAKING_CACHE_TTL = 0.3  # Check every 300ms
+    pids: dict[str, list[int]] = {name: [] for name in _TTS_PROCESS_NAMES}
+    try:
+        output = subprocess.run(
+            ["ps", "-Ao", "pid=,comm="],
+            capture_output=True,
+            text=True
+        ).stdout
+    except OSError as e:
+        log.debug(f"ps failed: {e}")
+        output = ""
+    for line in output.splitlines():
+        pid, _, command = line.strip().partition(" ")
+        # comm is the full executable path on macOS
+        name = os.path.basename(command.strip())
+        if name in pids:
+            pids[name].append(int(pid))
+
+    snapshot.pids = pids
+    snapshot.timestamp = now
+    return pids
 
 
 def is_speaking() -> bool:
     """
     Check if claude-say is currently speaking.
 
-    Uses caching to avoid spawning a subprocess on every audio chunk.
-    The cache is refreshed every 300ms.
+    When this process owns the player (registered through
+    VoiceCoordinator.start_speaking), its liveness is checked directly.
+    Otherwise (claude-listen asking about claude-say) falls back to a ps
+    snapshot, shared for 300ms to avoid spawning a subprocess on every
+    audio chunk.
 
     Returns:
         True if TTS is active
     """
-    import time
+    proc = _coordinator._proc if _coordinator is not None else None
+    if proc is not None:
+        return proc.poll() is None
 
-    now = time.time()
-
-    # Return cached value if still valid
-    if now - _is_speaking_cache["timestamp"] < _IS_SPEAKING_CACHE_TTL:
-        return _is_speaking_cache["value"]
-
-    # Refresh cache
-    try:
-        # Check if macOS 'say' process is running
-        result = subprocess.run(
-            ["pgrep", "-x", "say"],
-            capture_output=True,
-            text=True
-        )
-        is_active = result.returncode == 0
-        _is_speaking_cache["value"] = is_active
-        _is_speaking_cache["timestamp"] = now
-        return is_active
-    except Exception:
-        _is_speaking_cache["value"] = False
-        _is_speaking_cache["timestamp"] = now
-        return False
+    # Check if macOS 'say' process is running
+    return bool(_tts_process_pids()["say"])
 
 
 def clear_stop_signal() -> None:
     """Clear any pending stop signal."""
-    if STOP_SIGNAL_FILE.exists():
-        try:
-            STOP_SIGNAL_FILE.unlink()
-        except Exception:
-            pass
+    _stop_event.clear()
+    try:
+        os.unlink(_STOP_SIGNAL_PATH)
+    except OSError:
+        pass
 
 
 # ============================================================================
@@ -201,6 +313,7 @@ def signal_tts_complete() -> bool:
         True if signal was sent successfully
     """
     log.info("signal_tts_complete() called")
+    _tts_complete_event.set()
     try:
         TTS_COMPLETE_SIGNAL_FILE.touch()
         log.info(f"TTS complete signal created: {TTS_COMPLETE_SIGNAL_FILE}")
@@ -223,34 +336,106 @@ def wait_for_tts_complete(timeout: float = 30.0) -> bool:
     Returns:
         True if signal received, False on timeout
     """
-    import time
-
     log.info(f"Waiting for TTS complete signal (timeout={timeout}s)...")
-    start_time = time.time()
-
-    while time.time() - start_time < timeout:
-        if TTS_COMPLETE_SIGNAL_FILE.exists():
-            log.info("TTS complete signal received!")
-            # Clear the signal
+    deadline = time.monotonic() + timeout
+
+    # Sleep on directory-change events instead of polling: the signal file
+    # appearing wakes us immediately (kqueue on macOS, else polling)
+    watch = _watch_directory(TTS_COMPLETE_SIGNAL_FILE.parent)
+    # Polling fallback backs off geometrically while nothing happens in the
+    # directory, and snaps back when its mtime moves
+    interval = _POLL_MIN_INTERVAL
+    dir_mtime = None
+    try:
+        while True:
+            if _tts_complete_event.is_set():
+                _tts_complete_event.clear()
+                _consume_signal_file(_TTS_COMPLETE_SIGNAL_PATH)  # Same signal
+                log.info("TTS complete signal received (in-process)")
+                return True
+            if _consume_signal_file(_TTS_COMPLETE_SIGNAL_PATH):
+                log.info("TTS complete signal received!")
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if watch is not None:
+                watch[0].control(None, 1, remaining)
+                continue
             try:
-                TTS_COMPLETE_SIGNAL_FILE.unlink()
-            except Exception:
-                pass
-            return True
-        time.sleep(0.05)  # Poll every 50ms
+                mtime = TTS_COMPLETE_SIGNAL_FILE.parent.stat().st_mtime_ns
+            except OSError:
+                mtime = None
+            if mtime != dir_mtime:
+                dir_mtime = mtime
+                interval = _POLL_MIN_INTERVAL
+            _tts_complete_event.wait(min(interval, remaining))
+            interval = min(interval * _POLL_BACKOFF, _POLL_MAX_INTERVAL)
+    finally:
+        if watch is not None:
+            kq, fd = watch
+            kq.close()
+            os.close(fd)
 
     log.warning(f"Timeout waiting for TTS complete signal after {timeout}s")
     return False
 
 
+# Polling bounds for wait_for_tts_complete() where kqueue is unavailable
+_POLL_MIN_INTERVAL = 0.01
+_POLL_MAX_INTERVAL = 0.5
+_POLL_BACKOFF = 1.5
+
+
+def _consume_signal_file(path: str) -> bool:
+    """Remove a signal file; True if it was present."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        pass  # Present but not removable: still a signal
+    return True
+
+
+def _watch_directory(directory: Path):
+    """
+    Watch a directory for entries being added or removed.
+
+    Returns:
+        (kqueue, directory fd) to close after use, or None where kqueue
+        is unavailable
+    """
+    if not hasattr(select, "kqueue"):
+        return None
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError as e:
+        log.debug(f"Cannot watch {directory}: {e}")
+        return None
+    try:
+        kq = select.kqueue()
+        kq.control([select.kevent(
+            fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE,
+        )], 0, 0)
+    except OSError as e:
+        os.close(fd)
+        log.debug(f"Cannot watch {directory}: {e}")
+        return None
+    return kq, fd
+
+
 def clear_tts_complete_signal() -> None:
     """Clear any pending TTS complete signal."""
-    if TTS_COMPLETE_SIGNAL_FILE.exists():
-        try:
-            TTS_COMPLETE_SIGNAL_FILE.unlink()
-            log.debug("Cleared stale TTS complete signal")
-        except Exception:
-            pass
+    _tts_complete_event.clear()
+    try:
+        os.unlink(_TTS_COMPLETE_SIGNAL_PATH)
+    except OSError:
+        return
+    log.debug("Cleared stale TTS complete signal")
 
 
 def clear_barge_in_signal() -> None:
@@ -260,12 +445,11 @@ def clear_barge_in_signal() -> None:
     Called by claude-listen when transcription is ready,
     allowing speak_and_wait to work again for the next conversation turn.
     """
-    if BARGE_IN_SIGNAL_FILE.exists():
-        try:
-            BARGE_IN_SIGNAL_FILE.unlink()
-            log.info("Cleared barge-in signal (speak_and_wait re-enabled)")
-        except Exception:
-            pass
+    try:
+        os.unlink(_BARGE_IN_SIGNAL_PATH)
+    except OSError:
+        return
+    log.info("Cleared barge-in signal (speak_and_wait re-enabled)")
 
 
 class VoiceCoordinator:
@@ -277,9 +461,12 @@ class VoiceCoordinator:
     - No feedback loop (not listening to TTS output)
     """
 
+    __slots__ = ("_listening", "_speaking", "_proc")
+
     def __init__(self):
         self._listening = False
         self._speaking = False
+        self._proc: Optional[subprocess.Popen] = None
 
     def start_listening(self) -> None:
         """Mark that STT is active."""
@@ -289,13 +476,20 @@ class VoiceCoordinator:
         """Mark that STT is inactive."""
         self._listening = False
 
-    def start_speaking(self) -> None:
-        """Mark that TTS is active."""
+    def start_speaking(self, proc: Optional[subprocess.Popen] = None) -> None:
+        """
+        Mark that TTS is active.
+
+        Args:
+            proc: Optional player process, polled by is_speaking()
+        """
         self._speaking = True
+        self._proc = proc
 
     def stop_speaking(self) -> None:
         """Mark that TTS is inactive."""
         self._speaking = False
+        self._proc = None
 
     @property
     def is_listening(self) -> bool:
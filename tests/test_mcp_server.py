@@ -0,0 +1,149 @@
+"""
+Tests for the claude-say MCP server's pure-Python helpers
+
+Requirements:
+- pytest
+- mcp
+
+Run: pytest tests/test_mcp_server.py -v
+"""
+
+import pytest
+
+# Skip tests if the MCP SDK is not installed
+pytest.importorskip("mcp")
+
+import mcp_server
+from mcp_server import _parse_env_file, take_coalescable_speech, MAX_SPEECH_BATCH
+
+
+def legacy_parse_env(text: str) -> dict:
+    """The line-by-line .env parser _parse_env_file replaced (reference)."""
+    env_vars = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if '=' in line:
+            key, val = line.split('=', 1)
+            key = key.strip()
+            val = val.strip()
+            if val and len(val) >= 2:
+                if (val[0] == '"' and val[-1] == '"') or (val[0] == "'" and val[-1] == "'"):
+                    val = val[1:-1]
+            env_vars[key] = val
+    return env_vars
+
+
+ENV_CASES = [
+    "KEY=value",
+    "KEY = value  ",
+    "  KEY=value",
+    'KEY="quoted value"',
+    "KEY='single quoted'",
+    'KEY=""',
+    'KEY="',
+    "KEY='mismatched\"",
+    'KEY="inner "quotes" kept"',
+    "KEY=a=b=c",
+    "KEY=value # not a comment",
+    "KEY=",
+    "# KEY=commented",
+    "   # indented comment",
+    "#KEY=value",
+    "no equals sign here",
+    "MY KEY=spaced key",
+    "KEY=first\nKEY=second",
+    "A=1\n\n\nB=2\n",
+    "A=1\r\nB='two'\r\n",
+    "\tKEY\t=\tvalue\t",
+]
+
+
+class TestParseEnvFile:
+    """Test the regex .env parser against the line-by-line parser it replaced."""
+
+    @pytest.mark.parametrize("text", ENV_CASES)
+    def test_matches_legacy_parser(self, tmp_path, text):
+        """Test that every case parses exactly as before."""
+        env_path = tmp_path / ".env"
+        env_path.write_text(text)
+        assert _parse_env_file(env_path) == legacy_parse_env(env_path.read_text())
+
+    def test_quotes_and_comments(self, tmp_path):
+        """Test quote stripping and comment skipping on a realistic file."""
+        env_path = tmp_path / ".env"
+        env_path.write_text(
+            "# claude-say config\n"
+            "TTS_BACKEND=google\n"
+            'GOOGLE_CLOUD_API_KEY="abc=123"\n'
+            "GOOGLE_VOICE='en-US-Neural2-F'\n"
+            "  # KOKORO_VOICE=af_heart\n"
+        )
+        assert _parse_env_file(env_path) == {
+            "TTS_BACKEND": "google",
+            "GOOGLE_CLOUD_API_KEY": "abc=123",
+            "GOOGLE_VOICE": "en-US-Neural2-F",
+        }
+
+
+@pytest.fixture
+def speech_queue():
+    """The server's speech deque, emptied before and after each test."""
+    mcp_server.speech_deque.clear()
+    yield mcp_server.speech_deque
+    mcp_server.speech_deque.clear()
+
+
+def item(text, voice="Samantha", rate=200, use_neural=False):
+    """A queued speech item, as enqueue_speech() builds it."""
+    return (text, voice, rate, use_neural, None)
+
+
+class TestTakeCoalescableSpeech:
+    """Test merging of queued speech items."""
+
+    def test_takes_matching_items(self, speech_queue):
+        """Test that items with the same voice, rate and backend are taken."""
+        speech_queue.extend([item("b"), item("c")])
+        taken = take_coalescable_speech("Samantha", 200, False)
+        assert [queued[0] for queued in taken] == ["b", "c"]
+        assert not speech_queue
+
+    def test_stops_at_voice_change(self, speech_queue):
+        """Test that a different voice ends the batch and stays queued."""
+        speech_queue.extend([item("b"), item("c", voice="Daniel"), item("d")])
+        taken = take_coalescable_speech("Samantha", 200, False)
+        assert [queued[0] for queued in taken] == ["b"]
+        assert [queued[0] for queued in speech_queue] == ["c", "d"]
+
+    def test_stops_at_rate_change(self, speech_queue):
+        """Test that a different rate ends the batch and stays queued."""
+        speech_queue.extend([item("b", rate=250), item("c")])
+        taken = take_coalescable_speech("Samantha", 200, False)
+        assert taken == []
+        assert [queued[0] for queued in speech_queue] == ["b", "c"]
+
+    def test_stops_at_backend_change(self, speech_queue):
+        """Test that say and neural items are never merged."""
+        speech_queue.extend([item("b", use_neural=True)])
+        assert take_coalescable_speech("Samantha", 200, False) == []
+        assert len(speech_queue) == 1
+
+    def test_stops_at_worker_sentinel(self, speech_queue):
+        """Test that the worker's None sentinel is left at the front."""
+        speech_queue.extend([item("b"), None, item("c")])
+        taken = take_coalescable_speech("Samantha", 200, False)
+        assert [queued[0] for queued in taken] == ["b"]
+        assert speech_queue[0] is None
+
+    def test_batch_size_limit(self, speech_queue):
+        """Test that at most MAX_SPEECH_BATCH - 1 items join the current one."""
+        speech_queue.extend(item(str(i)) for i in range(MAX_SPEECH_BATCH + 2))
+        taken = take_coalescable_speech("Samantha", 200, False)
+        assert len(taken) == MAX_SPEECH_BATCH - 1
+        assert len(speech_queue) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
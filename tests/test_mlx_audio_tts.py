@@ -56,6 +56,16 @@ class TestMLXAudioTTSInit:
             tts = MLXAudioTTS(speed=speed)
             assert tts.speed == speed
 
+    def test_init_invalid_quant_bits(self):
+        """Test that unsupported quantization widths raise ValueError."""
+        with pytest.raises(ValueError, match="quant_bits must be"):
+            MLXAudioTTS(quant_bits=3)
+
+    def test_init_invalid_dtype(self):
+        """Test that unsupported weight dtypes raise ValueError."""
+        with pytest.raises(ValueError, match="dtype must be"):
+            MLXAudioTTS(dtype="int8")
+
 
 class TestMLXAudioTTSVoices:
     """Test voice management."""
@@ -198,12 +208,12 @@ class TestMLXAudioTTSModelManagement:
 
         # Model should be None initially
         assert tts._model is None
-        assert tts._pipeline is None
+        assert not tts._pipelines
 
         # Model should be loaded after first synthesis
         tts.synthesize("Hello")
         assert tts._model is not None
-        assert tts._pipeline is not None
+        assert "a" in tts._pipelines
 
     def test_unload_model(self):
         """Test unloading model to free memory."""
@@ -216,7 +226,7 @@ class TestMLXAudioTTSModelManagement:
         # Unload
         tts.unload_model()
         assert tts._model is None
-        assert tts._pipeline is None
+        assert not tts._pipelines
 
     def test_model_reuse_for_multiple_syntheses(self):
         """Test that model is reused for multiple syntheses."""
@@ -235,6 +245,17 @@ class TestMLXAudioTTSModelManagement:
         assert len(audio1) > 0
         assert len(audio2) > 0
 
+    def test_language_switch_shares_model(self):
+        """Test that switching languages keeps the model and both pipelines."""
+        tts = MLXAudioTTS(cache_model=True)
+
+        tts.synthesize("Hello")
+        model = tts._model
+        tts.synthesize("Bonjour", voice="ff_siwis")
+
+        assert tts._model is model
+        assert set(tts._pipelines) == {"a", "f"}
+
 
 class TestMLXAudioTTSIntegration:
     """Integration tests."""
@@ -0,0 +1,151 @@
+"""
+Tests for the Silero VAD audio ring and chunking
+
+The model is replaced by a recorder, so no Silero download is needed.
+
+Requirements:
+- pytest
+- torch
+
+Run: pytest tests/test_vad.py -v
+"""
+
+import threading
+
+import pytest
+import numpy as np
+
+# Skip tests if torch not installed
+torch = pytest.importorskip("torch")
+
+from listen.vad import (
+    SileroVAD, SILERO_CHUNK_SAMPLES, RING_BUFFER_CHUNKS, EVENT_QUEUE_SIZE,
+    EVENT_SPEECH_START, EVENT_SPEECH_END,
+)
+
+
+class RecordingModel:
+    """Stands in for the Silero model: records every chunk it is given."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def __call__(self, chunk, sample_rate):
+        self.chunks.append(chunk.numpy().copy())
+        return torch.tensor(0.0)
+
+    def reset_states(self):
+        pass
+
+    def seen(self) -> np.ndarray:
+        if not self.chunks:
+            return np.empty(0, dtype=np.float32)
+        return np.concatenate(self.chunks)
+
+
+@pytest.fixture
+def vad():
+    """A started SileroVAD running on a RecordingModel."""
+    vad = SileroVAD()
+    vad._model = RecordingModel()  # start() skips loading when a model is set
+    vad._torch = torch
+    vad._ring_tensor = torch.from_numpy(vad._ring)
+    vad.start()
+    yield vad
+    vad.stop()
+
+
+def signal(num_samples: int) -> np.ndarray:
+    """Distinct samples, all loud enough to pass the silence pre-gate."""
+    return (0.1 + 0.5 * np.arange(num_samples) / num_samples).astype(np.float32)
+
+
+class TestSileroVADRing:
+    """Test the preallocated audio ring behind process_audio()."""
+
+    def test_backlog_chunking(self, vad):
+        """Test that a multi-chunk write runs each full chunk, in order."""
+        audio = signal(SILERO_CHUNK_SAMPLES * 5 + 100)
+
+        vad.process_audio(audio)
+
+        model = vad._model
+        assert len(model.chunks) == 5
+        assert all(len(chunk) == SILERO_CHUNK_SAMPLES for chunk in model.chunks)
+        np.testing.assert_array_equal(model.seen(), audio[:SILERO_CHUNK_SAMPLES * 5])
+        assert vad._write_idx - vad._read_idx == 100
+
+    def test_remainder_completes_next_chunk(self, vad):
+        """Test that a partial chunk is finished by the next write."""
+        audio = signal(SILERO_CHUNK_SAMPLES * 2)
+
+        vad.process_audio(audio[:300])
+        assert vad._model.chunks == []
+        vad.process_audio(audio[300:])
+
+        np.testing.assert_array_equal(vad._model.seen(), audio)
+        assert vad._read_idx == vad._write_idx == 0  # Drained: rewound
+
+    def test_ring_wrap(self, vad):
+        """Test that compaction keeps unread samples in order across many writes."""
+        audio = signal(len(vad._ring) * 3 + 123)
+        ring_size = len(vad._ring)
+
+        # 700-sample writes never line up with the chunk size, so a
+        # remainder is pending every time the ring fills up
+        for start in range(0, len(audio), 700):
+            vad.process_audio(audio[start:start + 700])
+
+        full = len(audio) // SILERO_CHUNK_SAMPLES * SILERO_CHUNK_SAMPLES
+        np.testing.assert_array_equal(vad._model.seen(), audio[:full])
+        assert len(vad._ring) == ring_size  # Compacted in place, never grown
+
+    def test_ring_growth(self, vad):
+        """Test that a write larger than the ring grows it without losing samples."""
+        ring_size = SILERO_CHUNK_SAMPLES * RING_BUFFER_CHUNKS
+        audio = signal(ring_size * 2 + 300)
+
+        vad.process_audio(audio[:300])  # Leave a remainder pending
+        vad.process_audio(audio[300:])
+
+        assert len(vad._ring) >= ring_size * 2
+        assert len(vad._abs_scratch) == len(vad._ring)
+        assert np.shares_memory(vad._ring_tensor.numpy(), vad._ring)
+        full = len(audio) // SILERO_CHUNK_SAMPLES * SILERO_CHUNK_SAMPLES
+        np.testing.assert_array_equal(vad._model.seen(), audio[:full])
+
+    def test_not_running_ignores_audio(self, vad):
+        """Test that audio after stop() is not buffered or run."""
+        vad.stop()
+        assert vad.process_audio(signal(SILERO_CHUNK_SAMPLES)) is False
+        assert vad._model.chunks == []
+
+
+class TestSileroVADStop:
+    """Test stop() against the bounded callback queue."""
+
+    def test_stop_from_callback_with_full_queue(self, vad):
+        """Test that a callback calling stop() on a full queue does not hang."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def on_start():
+            entered.set()
+            release.wait(timeout=5)
+            vad.stop()
+
+        vad.on_speech_start = on_start
+        worker = vad._cb_thread
+        vad._emit(EVENT_SPEECH_START)
+        assert entered.wait(timeout=5)
+        for _ in range(EVENT_QUEUE_SIZE):
+            vad._emit(EVENT_SPEECH_END)
+        assert vad._event_q.full()
+
+        release.set()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
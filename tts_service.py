@@ -6,20 +6,33 @@ Keeps the model loaded in memory for fast inference.
 Supports voice cloning from reference audio samples.
 """
 
+import asyncio
+import functools
 import os
+import re
+import shutil
+import struct
 import tempfile
 import subprocess
 import threading
 import logging
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+import torch
 import uvicorn
 
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # OSError: PortAudio library missing
+    # Playback falls back to a temp WAV file + afplay
+    sd = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("chatterbox-tts")
@@ -29,24 +42,74 @@ VOICES_DIR = Path(os.getenv("VOICES_DIR", Path(__file__).parent / "voices"))
 VOICES_DIR.mkdir(exist_ok=True)
 MAX_TEXT_LENGTH = int(os.getenv("MAX_TEXT_LENGTH", "2000"))
 TTS_PORT = int(os.getenv("TTS_PORT", "8123"))
+# Generated audio for short, repeated phrases ("Sure.", "Let me check.") is
+# kept in memory and replayed without touching the model
+SPEECH_CACHE_SIZE = int(os.getenv("SPEECH_CACHE_SIZE", "256"))
+SPEECH_CACHE_MAX_CHARS = 80
 
 # Temp file prefix for targeted cleanup
 TEMP_PREFIX = "chatterbox_tts_"
 
+# Resolved once, so spawning the fallback player skips the PATH walk
+AFPLAY = shutil.which("afplay") or "/usr/bin/afplay"
+
 # Global model instance (loaded once at startup)
 tts_model = None
 model_load_error: str | None = None
 
+# Prepared voice conditionals by (sample path, mtime): a cloned voice is
+# encoded once, not on every request. The built-in voice's conds are kept
+# aside because generate() works on whatever model.conds holds.
+VOICE_COND_CACHE_SIZE = 8
+_voice_conds: OrderedDict = OrderedDict()
+_default_conds = None
+generate_lock = threading.Lock()  # model.conds is swapped per call
+
 # Track active playback processes for targeted stop
-active_processes: list[subprocess.Popen] = []
+active_processes: set = set()  # subprocess.Popen or asyncio.subprocess.Process
 process_lock = threading.Lock()
 
+# Temp WAVs written by this process and not yet removed, so /stop can clean
+# up without scanning the temp directory
+temp_files: set[str] = set()
+
+# Voice name -> sample path, invalidated when the voices directory's mtime changes
+_voices_cache: dict[str, str] | None = None
+_voices_cache_mtime: int | None = None
+
 # Thread pool for async playback (bounded to prevent thread pile-up)
 playback_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts_playback")
 
+# All model runs go through this one worker (the device runs one generate at
+# a time anyway), so they never hold Starlette threadpool slots that /health
+# and /voices need. /speak generates its next sentence here while one plays
+synthesis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts_synth")
+
+# Writes temp WAVs off the event loop, overlapping the next model run
+io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts_io")
+
+# Bumped by /stop: a pipelined /speak started earlier drops its remaining sentences
+stop_generation = 0
+
+# Long-lived output stream for in-process playback (opened lazily, one
+# writer at a time): no player process or stream setup per utterance
+_pcm_stream = None
+_pcm_lock = threading.Lock()
+PCM_WRITE_FRAMES = 1024  # ~43 ms at 24 kHz: how often a /stop is noticed
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# 44-byte header of a 24 kHz mono 16-bit PCM WAV; save_temp_wav() patches
+# the two size fields
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_HEADER_TEMPLATE = _WAV_HEADER.pack(
+    b"RIFF", 0, b"WAVE", b"fmt ", 16, 1, 1, 24000, 24000 * 2, 2, 16, b"data", 0
+)
+
 
 class TTSRequest(BaseModel):
-    text: str
+    # Length is enforced by pydantic-core while parsing; over-long text gets a 422
+    text: Annotated[str, Field(min_length=1, max_length=MAX_TEXT_LENGTH)]
     speed: float = 1.0  # Note: speed is ignored for neural TTS (uses natural pacing)
     voice: Optional[str] = None  # Name of voice sample file (without .wav extension)
 
@@ -56,15 +119,27 @@ class TTSResponse(BaseModel):
     message: str
 
 
+def get_voices() -> dict[str, str]:
+    """Map voice names to sample paths, rescanning only when the directory changes."""
+    global _voices_cache, _voices_cache_mtime
+    # Adding or removing a sample bumps the directory mtime: one stat() per
+    # call instead of a directory scan
+    mtime = VOICES_DIR.stat().st_mtime_ns
+    if _voices_cache is None or mtime != _voices_cache_mtime:
+        _voices_cache = {f.stem: str(f) for f in VOICES_DIR.glob("*.wav")}
+        _voices_cache_mtime = mtime
+    return _voices_cache
+
+
 def get_voice_path(voice_name: Optional[str]) -> Optional[str]:
     """Get the path to a voice sample file."""
     if not voice_name:
         return None
 
     # Check in voices directory
-    voice_path = VOICES_DIR / f"{voice_name}.wav"
-    if voice_path.exists():
-        return str(voice_path)
+    voice_path = get_voices().get(voice_name)
+    if voice_path:
+        return voice_path
 
     # Check if it's an absolute path
     if os.path.exists(voice_name):
@@ -76,7 +151,6 @@ def get_voice_path(voice_name: Optional[str]) -> Optional[str]:
 def get_device() -> str:
     """Determine the best device for inference."""
     try:
-        import torch
         if torch.backends.mps.is_available():
             return "mps"
         logger.warning("Torch MPS unavailable, falling back to CPU")
@@ -87,7 +161,7 @@ def get_device() -> str:
 
 def load_model():
     """Load Chatterbox model into memory."""
-    global tts_model, model_load_error
+    global tts_model, model_load_error, _default_conds
     if tts_model is None:
         try:
             logger.info("Loading Chatterbox TTS model...")
@@ -95,6 +169,7 @@ def load_model():
             device = get_device()
             logger.info(f"Using device: {device}")
             tts_model = ChatterboxTTS.from_pretrained(device=device)
+            _default_conds = tts_model.conds
             logger.info("Model loaded successfully!")
             model_load_error = None
         except Exception as e:
@@ -103,27 +178,210 @@ def load_model():
     return tts_model
 
 
+def warm_up_model():
+    """Run one throwaway generation so the first request skips kernel compilation."""
+    try:
+        generate_speech("Ready.")
+        logger.info("Model warmed up")
+    except Exception as e:
+        logger.warning(f"Model warmup failed: {e}")
+
+
 def generate_speech(text: str, voice_path: Optional[str] = None):
-    """Generate speech audio (blocking, CPU/GPU intensive)."""
+    """Generate speech audio (blocking, CPU/GPU intensive unless cached)."""
+    text = text.strip()
+    if len(text) <= SPEECH_CACHE_MAX_CHARS:
+        # The sample's mtime is part of the key, as in voice_conds(): a voice
+        # re-recorded under the same name is not served from stale audio
+        voice_mtime = os.stat(voice_path).st_mtime_ns if voice_path else None
+        return _generate_speech_cached(text, voice_path, voice_mtime)
+    return _generate_speech(text, voice_path)
+
+
+@functools.lru_cache(maxsize=SPEECH_CACHE_SIZE)  # 0 disables caching
+def _generate_speech_cached(text: str, voice_path: Optional[str], voice_mtime: Optional[int]):
+    """Short phrases: generated once per (text, voice version), kept on the CPU."""
+    return _generate_speech(text, voice_path).detach().cpu()
+
+
+def _generate_speech(text: str, voice_path: Optional[str] = None):
+    """Run the model."""
     global tts_model
     if tts_model is None:
         load_model()
 
-    if voice_path:
-        return tts_model.generate(text, audio_prompt_path=voice_path)
-    else:
+    # inference_mode also covers encoding a new voice sample, which
+    # generate() does not wrap
+    with generate_lock, torch.inference_mode():
+        tts_model.conds = voice_conds(voice_path) if voice_path else _default_conds
         return tts_model.generate(text)
 
 
-def play_audio_blocking(temp_path: str):
-    """Play audio and clean up afterward (blocking)."""
+def voice_conds(voice_path: str):
+    """Conditionals for a voice sample, prepared once per file version."""
+    key = (voice_path, os.stat(voice_path).st_mtime_ns)
+    conds = _voice_conds.get(key)
+    if conds is None:
+        tts_model.prepare_conditionals(voice_path)
+        conds = tts_model.conds
+        _voice_conds[key] = conds
+        if len(_voice_conds) > VOICE_COND_CACHE_SIZE:
+            _voice_conds.popitem(last=False)
+    else:
+        _voice_conds.move_to_end(key)
+    return conds
+
+
+def split_sentences(text: str) -> list[str]:
+    """Split text at sentence ends; the whole text if there is only one sentence."""
+    return [s for s in _SENTENCE_SPLIT_RE.split(text.strip()) if s] or [text]
+
+
+def to_pcm16(wav):
+    """
+    Generated audio as a flat int16 NumPy array.
+
+    Chatterbox's generate() returns a CPU tensor (its watermarker works in
+    NumPy), so .cpu() is a no-op here; it only guards other callers.
+    """
+    return (wav.detach().clamp(-1, 1) * 32767).short().cpu().numpy().reshape(-1)
+
+
+def save_temp_wav(wav) -> str:
+    """Save generated audio to a temp file (16-bit WAV) with the service prefix."""
+    pcm = to_pcm16(wav)
+    header = bytearray(_WAV_HEADER_TEMPLATE)
+    struct.pack_into("<I", header, 4, 36 + pcm.nbytes)  # RIFF chunk size
+    struct.pack_into("<I", header, 40, pcm.nbytes)  # data chunk size
+
+    fd, temp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, suffix=".wav")
+    with process_lock:
+        temp_files.add(temp_path)
     try:
-        subprocess.run(["afplay", temp_path], check=True)
+        # Header and samples in one syscall, no encoder in between
+        data = memoryview(pcm).cast("B")
+        written = os.writev(fd, [header, data])
+        if written < len(header) + len(data):  # Short write (rare): finish plainly
+            rest = memoryview(bytes(header) + data.tobytes())[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
     finally:
+        os.close(fd)
+    return temp_path
+
+
+def remove_temp_wav(temp_path: str) -> None:
+    """Delete a temp WAV written by save_temp_wav."""
+    with process_lock:
+        temp_files.discard(temp_path)
+    try:
+        os.unlink(temp_path)
+    except OSError:
+        pass
+
+
+def remove_stale_temp_wavs() -> None:
+    """Delete temp WAVs left behind by an earlier run of the service."""
+    with os.scandir(tempfile.gettempdir()) as entries:
+        for entry in entries:
+            if entry.name.startswith(TEMP_PREFIX) and entry.name.endswith(".wav"):
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+
+
+async def speak_pipelined(text: str, voice_path: Optional[str] = None) -> bool:
+    """
+    Generate and play text sentence by sentence.
+
+    Each sentence plays while the next one is generated, so audio starts
+    after the first sentence instead of the whole text.
+
+    Returns:
+        True if every sentence played, False if /stop (or a killed
+        player) interrupted
+    """
+    loop = asyncio.get_running_loop()
+    generation = stop_generation
+    sentences = split_sentences(text)
+    pending = loop.run_in_executor(synthesis_executor, generate_speech, sentences[0], voice_path)
+    for i in range(len(sentences)):
+        wav = await pending
+        if i + 1 < len(sentences):
+            pending = loop.run_in_executor(
+                synthesis_executor, generate_speech, sentences[i + 1], voice_path
+            )
+        if generation == stop_generation:
+            if sd is not None:
+                # Straight from memory to PortAudio: no file, no player process
+                await run_in_threadpool(
+                    play_pcm, to_pcm16(wav), generation
+                )
+            else:
+                temp_path = await loop.run_in_executor(io_executor, save_temp_wav, wav)
+                if await play_audio_file(temp_path):
+                    # afplay was killed, by /stop or from outside (barge-in)
+                    pending.cancel()
+                    return False
+        if generation != stop_generation:
+            pending.cancel()
+            return False
+    return True
+
+
+def play_pcm(samples, generation: int) -> None:
+    """
+    Play mono int16 samples on the shared output stream (blocking).
+
+    Stops early once /stop has bumped stop_generation past generation.
+    """
+    global _pcm_stream
+    samples = samples.reshape(-1, 1)
+    with _pcm_lock:
+        if _pcm_stream is None:
+            _pcm_stream = sd.OutputStream(samplerate=24000, channels=1, dtype="int16")
+        _pcm_stream.start()
         try:
-            os.unlink(temp_path)
-        except:
-            pass
+            for start in range(0, len(samples), PCM_WRITE_FRAMES):
+                if generation != stop_generation:
+                    _pcm_stream.abort()  # Drop whatever is still buffered
+                    return
+                _pcm_stream.write(samples[start:start + PCM_WRITE_FRAMES])
+        finally:
+            if _pcm_stream.active:
+                _pcm_stream.stop()  # Returns once the buffered tail has played
+
+
+async def play_audio_file(temp_path: str) -> bool:
+    """
+    Play audio and clean up afterward (interruptible by /stop).
+
+    Returns:
+        True if afplay was killed by a signal before finishing
+    """
+    try:
+        # The event loop waits on the child: no thread parked for the
+        # length of the audio
+        proc = await asyncio.create_subprocess_exec(
+            AFPLAY, temp_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        # Tracked like async playback, so /stop can terminate it
+        with process_lock:
+            active_processes.add(proc)
+        try:
+            returncode = await proc.wait()
+        finally:
+            with process_lock:
+                active_processes.discard(proc)
+        if returncode > 0:
+            raise subprocess.CalledProcessError(returncode, [AFPLAY, temp_path])
+        # Negative: terminated by a signal, from /stop or another process
+        return returncode < 0
+    finally:
+        remove_temp_wav(temp_path)
 
 
 def play_audio_async(temp_path: str):
@@ -131,26 +389,23 @@ def play_audio_async(temp_path: str):
     def _play():
         proc = None
         try:
+            # Python fds are non-inheritable (PEP 446), so skipping the
+            # close_fds sweep is safe and lets CPython use posix_spawn
             proc = subprocess.Popen(
-                ["afplay", temp_path],
+                [AFPLAY, temp_path],
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
             )
             with process_lock:
-                active_processes.append(proc)
+                active_processes.add(proc)
             try:
-                proc.wait()
-            except Exception:
-                # Process may have been terminated by /stop
-                pass
-            with process_lock:
-                if proc in active_processes:
-                    active_processes.remove(proc)
+                proc.wait()  # Returns early (negative code) if /stop terminates it
+            finally:
+                with process_lock:
+                    active_processes.discard(proc)
         finally:
-            try:
-                os.unlink(temp_path)
-            except:
-                pass
+            remove_temp_wav(temp_path)
 
     playback_executor.submit(_play)
 
@@ -158,12 +413,15 @@ def play_audio_async(temp_path: str):
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
-    # Startup: load model
+    # Startup: clear temp files orphaned by a previous run, then load model
+    remove_stale_temp_wavs()
     try:
         load_model()
     except Exception as e:
         logger.warning(f"Failed to load model at startup: {e}")
         logger.info("Model will be loaded on first request.")
+    else:
+        warm_up_model()
     yield
     # Shutdown: nothing to clean up
 
@@ -184,8 +442,7 @@ async def health_check():
 @app.get("/voices")
 async def list_voices():
     """List available voice samples."""
-    voices = [f.stem for f in VOICES_DIR.glob("*.wav")]
-    return {"voices": voices, "voices_dir": str(VOICES_DIR)}
+    return {"voices": list(get_voices()), "voices_dir": str(VOICES_DIR)}
 
 
 @app.post("/speak", response_model=TTSResponse)
@@ -197,33 +454,17 @@ async def speak(request: TTSRequest):
     Note: speed parameter is accepted for API compatibility but ignored
     for neural TTS (uses natural pacing).
     """
-    # Input validation
-    if len(request.text) > MAX_TEXT_LENGTH:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Text too long. Maximum {MAX_TEXT_LENGTH} characters allowed."
-        )
-
     try:
         # Get voice sample path for cloning
         voice_path = get_voice_path(request.voice)
 
-        # Generate audio in thread pool to avoid blocking event loop
-        wav = await run_in_threadpool(generate_speech, request.text, voice_path)
-
-        # Save to temp file with identifiable prefix
-        import torchaudio
-        with tempfile.NamedTemporaryFile(
-            prefix=TEMP_PREFIX, suffix=".wav", delete=False
-        ) as f:
-            temp_path = f.name
-            torchaudio.save(temp_path, wav.cpu(), 24000)
-
-        # Play the audio (blocking) in thread pool
-        await run_in_threadpool(play_audio_blocking, temp_path)
+        # Generate and play sentence by sentence; generation runs in the
+        # synthesis thread, so the event loop is never blocked
+        completed = await speak_pipelined(request.text, voice_path)
 
         voice_info = f" (voice: {request.voice})" if request.voice else ""
-        return TTSResponse(status="ok", message=f"Speech completed{voice_info}")
+        outcome = "completed" if completed else "stopped"
+        return TTSResponse(status="ok", message=f"Speech {outcome}{voice_info}")
 
     except HTTPException:
         raise
@@ -242,30 +483,28 @@ async def speak_async(request: TTSRequest):
     Note: speed parameter is accepted for API compatibility but ignored
     for neural TTS (uses natural pacing).
     """
-    # Input validation
-    if len(request.text) > MAX_TEXT_LENGTH:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Text too long. Maximum {MAX_TEXT_LENGTH} characters allowed."
-        )
-
     try:
         # Get voice sample path for cloning
         voice_path = get_voice_path(request.voice)
 
-        # Generate audio in thread pool to avoid blocking event loop
-        wav = await run_in_threadpool(generate_speech, request.text, voice_path)
+        # Generate audio on the model's executor to avoid blocking event loop
+        wav = await asyncio.get_running_loop().run_in_executor(
+            synthesis_executor, generate_speech, request.text, voice_path
+        )
 
-        # Save to temp file with identifiable prefix
-        import torchaudio
-        with tempfile.NamedTemporaryFile(
-            prefix=TEMP_PREFIX, suffix=".wav", delete=False
-        ) as f:
-            temp_path = f.name
-            torchaudio.save(temp_path, wav.cpu(), 24000)
+        if sd is not None:
+            # Plays on the shared output stream from the playback pool
+            playback_executor.submit(
+                play_pcm, to_pcm16(wav), stop_generation
+            )
+        else:
+            # Save to temp file with identifiable prefix
+            temp_path = await asyncio.get_running_loop().run_in_executor(
+                io_executor, save_temp_wav, wav
+            )
 
-        # Play the audio (non-blocking) with proper cleanup
-        play_audio_async(temp_path)
+            # Play the audio (non-blocking) with proper cleanup
+            play_audio_async(temp_path)
 
         voice_info = f" (voice: {request.voice})" if request.voice else ""
         return TTSResponse(status="ok", message=f"Speech started{voice_info}")
@@ -280,26 +519,27 @@ async def speak_async(request: TTSRequest):
 @app.post("/stop")
 async def stop_speaking():
     """Stop any currently playing audio spawned by this service."""
+    global stop_generation
     stopped = 0
+    # Take the players under the lock, signal them outside it
     with process_lock:
-        for proc in active_processes[:]:  # Copy list to avoid mutation during iteration
-            try:
-                proc.terminate()
-                stopped += 1
-            except:
-                pass
+        stop_generation += 1
+        procs = list(active_processes)
         active_processes.clear()
+    for proc in procs:
+        try:
+            proc.terminate()
+            stopped += 1
+        except OSError:
+            pass
 
-    # Also clean up any orphaned temp files
-    try:
-        import glob
-        for f in glob.glob(f"/tmp/{TEMP_PREFIX}*.wav"):
-            try:
-                os.unlink(f)
-            except:
-                pass
-    except:
-        pass
+    # In-process playback notices the bumped stop_generation between blocks
+
+    # Also clean up the temp files this process still holds
+    with process_lock:
+        pending_files = list(temp_files)
+    for temp_path in pending_files:
+        remove_temp_wav(temp_path)
 
     return {"status": "ok", "message": f"Stopped {stopped} process(es)"}
 